@@ -1,6 +1,28 @@
 # -*- coding: utf-8 -*-
 """The attribute container interface."""
 
+import functools
+
+from acstore.helpers import filter_expression as filter_expression_helper
+
+
+@functools.lru_cache(maxsize=256)
+def _CompileExpression(expression):
+  """Compiles an expression.
+
+  Args:
+    expression (str): expression.
+
+  Returns:
+    code|function: predicate that takes a namespace of attribute values or
+        compiled expression if the expression is not supported by the filter
+        expression helper.
+  """
+  try:
+    return filter_expression_helper.CompileFilterExpression(expression)
+  except TypeError:
+    return compile(expression, '<AttributeContainer>', 'eval')
+
 
 class AttributeContainerIdentifier(object):
   """The attribute container identifier.
@@ -13,6 +35,10 @@ class AttributeContainerIdentifier(object):
     sequence_number (int): sequence number of the attribute container.
   """
 
+  __slots__ = (
+      '_string', '_string_name', '_string_sequence_number', 'name',
+      'sequence_number')
+
   def __init__(self, name=None, sequence_number=None):
     """Initializes an attribute container identifier.
 
@@ -22,6 +48,9 @@ class AttributeContainerIdentifier(object):
           container.
     """
     super(AttributeContainerIdentifier, self).__init__()
+    self._string = None
+    self._string_name = None
+    self._string_sequence_number = None
     self.name = name
     self.sequence_number = sequence_number
 
@@ -31,8 +60,9 @@ class AttributeContainerIdentifier(object):
     Args:
       identifier_string (str): string representation.
     """
-    self.name, sequence_number = identifier_string.split('.')
-    self.sequence_number = int(sequence_number, 10)
+    self.name, _, sequence_number = identifier_string.rpartition('.')
+    self.sequence_number = int(sequence_number)
+    self._string = None
 
   def CopyToString(self):
     """Copies the identifier to a string representation.
@@ -40,10 +70,64 @@ class AttributeContainerIdentifier(object):
     Returns:
       str: unique identifier or None.
     """
-    if self.name is not None and self.sequence_number is not None:
-      return f'{self.name:s}.{self.sequence_number:d}'
+    name = self.name
+    sequence_number = self.sequence_number
 
-    return None
+    # The cached string representation is only used if the name and sequence
+    # number were not changed since it was created.
+    if (self._string is None or name != self._string_name or
+        sequence_number != self._string_sequence_number):
+      if name is None or sequence_number is None:
+        return None
+
+      self._string = f'{name:s}.{sequence_number:d}'
+      self._string_name = name
+      self._string_sequence_number = sequence_number
+
+    return self._string
+
+
+class _AttributeValuesNamespace(dict):
+  """Namespace that resolves attribute container values on demand.
+
+  Only the attribute values referenced by an expression are looked up and
+  converted, instead of all the attribute values of the container.
+  """
+
+  def __init__(self, attribute_container):
+    """Initializes an attribute values namespace.
+
+    Args:
+      attribute_container (AttributeContainer): attribute container.
+    """
+    super(_AttributeValuesNamespace, self).__init__()
+    self._attribute_container = attribute_container
+
+  def __missing__(self, key):
+    """Resolves the value of an attribute that is not in the namespace.
+
+    Args:
+      key (str): attribute name.
+
+    Returns:
+      object: attribute value.
+
+    Raises:
+      KeyError: if the attribute is not set or not serializable.
+    """
+    attribute_value = self._attribute_container.__dict__.get(key, None)
+
+    # Not using startswith to improve performance.
+    if attribute_value is None or (
+        key[0] == '_' and key not in (
+            self._attribute_container._SERIALIZABLE_PROTECTED_ATTRIBUTES)):  # pylint: disable=protected-access
+      raise KeyError(key)
+
+    if isinstance(attribute_value, AttributeContainerIdentifier):
+      attribute_value = attribute_value.CopyToString()
+
+    self[key] = attribute_value
+    return attribute_value
 
 
 class AttributeContainer(object):
@@ -59,19 +143,40 @@ class AttributeContainer(object):
   Attributes are public class members of an serializable type. Protected and
   private class members are not to be serialized, with the exception of those
   defined in _SERIALIZABLE_PROTECTED_ATTRIBUTES.
+
+  The comparable string and hash of the attribute values are cached on first
+  use. Containers are expected to be read-only after they have been filled,
+  callers that change attribute values afterwards must call
+  InvalidateComparable().
   """
 
   CONTAINER_TYPE = None
 
   # Names of protected attributes, those with a leading underscore, that
-  # should be serialized.
-  _SERIALIZABLE_PROTECTED_ATTRIBUTES = []
+  # should be serialized. Subclasses that define a list or tuple are converted
+  # to a frozenset by __init_subclass__.
+  _SERIALIZABLE_PROTECTED_ATTRIBUTES = frozenset()
+
+  # Names of protected attributes that cache values derived from the attribute
+  # values.
+  _COMPARABLE_CACHE_ATTRIBUTES = ('_comparable_hash', '_comparable_string')
+
+  def __init_subclass__(cls, **kwargs):
+    """Initializes an attribute container subclass.
+
+    Args:
+      kwargs (dict[str, object]): keyword arguments.
+    """
+    super(AttributeContainer, cls).__init_subclass__(**kwargs)
+    cls._SERIALIZABLE_PROTECTED_ATTRIBUTES = frozenset(
+        cls._SERIALIZABLE_PROTECTED_ATTRIBUTES)
 
   def __init__(self):
     """Initializes an attribute container."""
     super(AttributeContainer, self).__init__()
-    self._identifier = AttributeContainerIdentifier(
-        name=self.CONTAINER_TYPE, sequence_number=id(self))
+    self._comparable_hash = None
+    self._comparable_string = None
+    self._identifier = None
 
   def CopyFromDict(self, attributes):
     """Copies the attribute container from a dictionary.
@@ -79,11 +184,16 @@ class AttributeContainer(object):
     Args:
       attributes (dict[str, object]): attribute values per name.
     """
-    for attribute_name, attribute_value in attributes.items():
-      # Not using startswith to improve performance.
-      if (attribute_name[0] != '_' or
-          attribute_name in self._SERIALIZABLE_PROTECTED_ATTRIBUTES):
-        self.__dict__[attribute_name] = attribute_value
+    serializable_protected_attributes = self._SERIALIZABLE_PROTECTED_ATTRIBUTES
+
+    # Not using startswith to improve performance.
+    self.__dict__.update({
+        attribute_name: attribute_value
+        for attribute_name, attribute_value in attributes.items()
+        if attribute_name[0] != '_' or
+        attribute_name in serializable_protected_attributes})
+
+    self.InvalidateComparable()
 
   def CopyToDict(self):
     """Copies the attribute container to a dictionary.
@@ -91,21 +201,31 @@ class AttributeContainer(object):
     Returns:
       dict[str, object]: attribute values per name.
     """
-    return dict(self.GetAttributes())
+    serializable_protected_attributes = self._SERIALIZABLE_PROTECTED_ATTRIBUTES
+
+    # Not using startswith to improve performance.
+    return {
+        attribute_name: attribute_value
+        for attribute_name, attribute_value in self.__dict__.items()
+        if attribute_value is not None and (
+            attribute_name[0] != '_' or
+            attribute_name in serializable_protected_attributes)}
 
   def GetAttributeNames(self):
     """Retrieves the names of all attributes.
 
+    Serializable protected attributes are only included when they are set.
+
     Returns:
       list[str]: attribute names.
     """
-    attribute_names = list(self._SERIALIZABLE_PROTECTED_ATTRIBUTES)
-    for attribute_name in self.__dict__:
-      # Not using startswith to improve performance.
-      if attribute_name[0] != '_':
-        attribute_names.append(attribute_name)
+    serializable_protected_attributes = self._SERIALIZABLE_PROTECTED_ATTRIBUTES
 
-    return attribute_names
+    # Not using startswith to improve performance.
+    return [
+        attribute_name for attribute_name in self.__dict__
+        if attribute_name[0] != '_' or
+        attribute_name in serializable_protected_attributes]
 
   def GetAttributes(self):
     """Retrieves the attribute names and values.
@@ -115,11 +235,13 @@ class AttributeContainer(object):
     Yields:
       tuple[str, object]: attribute name and value.
     """
+    serializable_protected_attributes = self._SERIALIZABLE_PROTECTED_ATTRIBUTES
+
     for attribute_name, attribute_value in self.__dict__.items():
       # Not using startswith to improve performance.
       if attribute_value is not None and (
           attribute_name[0] != '_' or
-          attribute_name in self._SERIALIZABLE_PROTECTED_ATTRIBUTES):
+          attribute_name in serializable_protected_attributes):
         yield attribute_name, attribute_value
 
   def GetAttributeValuesHash(self):
@@ -128,7 +250,10 @@ class AttributeContainer(object):
     Returns:
       int: hash of comparable string of the attribute values.
     """
-    return hash(self.GetAttributeValuesString())
+    if self._comparable_hash is None:
+      self._comparable_hash = hash(self.GetAttributeValuesString())
+
+    return self._comparable_hash
 
   def GetAttributeValuesString(self):
     """Retrieves a comparable string of the attribute values.
@@ -136,21 +261,35 @@ class AttributeContainer(object):
     Returns:
       str: comparable string of the attribute values.
     """
+    if self._comparable_string is not None:
+      return self._comparable_string
+
+    serializable_protected_attributes = self._SERIALIZABLE_PROTECTED_ATTRIBUTES
+
+    attribute_values = self.__dict__
+
+    # Not using startswith to improve performance.
+    attribute_names = [
+        attribute_name
+        for attribute_name, attribute_value in attribute_values.items()
+        if attribute_value is not None and (
+            attribute_name[0] != '_' or
+            attribute_name in serializable_protected_attributes)]
+    attribute_names.sort()
+
     attributes = []
-    for attribute_name, attribute_value in sorted(self.__dict__.items()):
-      # Not using startswith to improve performance.
-      if attribute_value is not None and (
-          attribute_name[0] != '_' or
-          attribute_name in self._SERIALIZABLE_PROTECTED_ATTRIBUTES):
-        if isinstance(attribute_value, dict):
-          attribute_value = sorted(attribute_value.items())
+    for attribute_name in attribute_names:
+      attribute_value = attribute_values[attribute_name]
+      if isinstance(attribute_value, dict):
+        attribute_value = sorted(attribute_value.items())
 
-        elif isinstance(attribute_value, bytes):
-          attribute_value = repr(attribute_value)
+      elif isinstance(attribute_value, bytes):
+        attribute_value = repr(attribute_value)
 
-        attributes.append(f'{attribute_name:s}: {attribute_value!s}')
+      attributes.append(f'{attribute_name:s}: {attribute_value!s}')
 
-    return ', '.join(attributes)
+    self._comparable_string = ', '.join(attributes)
+    return self._comparable_string
 
   def GetIdentifier(self):
     """Retrieves the identifier.
@@ -160,11 +299,29 @@ class AttributeContainer(object):
     Returns:
       AttributeContainerIdentifier: an unique identifier for the container.
     """
+    # The default identifier is created on demand since most attribute
+    # containers are assigned an identifier by the store.
+    if self._identifier is None:
+      self._identifier = AttributeContainerIdentifier(
+          name=self.CONTAINER_TYPE, sequence_number=id(self))
+
     return self._identifier
 
+  def InvalidateComparable(self):
+    """Invalidates the cached comparable string and hash.
+
+    This method must be called when attribute values are changed after
+    GetAttributeValuesString or GetAttributeValuesHash have been called.
+    """
+    for attribute_name in self._COMPARABLE_CACHE_ATTRIBUTES:
+      self.__dict__[attribute_name] = None
+
   def MatchesExpression(self, expression):
     """Determines if an attribute container matches the expression.
 
+    The expression can only refer to attribute names, no builtins are
+    available.
+
     Args:
       expression (code|str): expression.
 
@@ -172,28 +329,26 @@ class AttributeContainer(object):
       bool: True if the attribute container matches the expression, False
           otherwise.
     """
-    result = not expression
-    if expression:
-      namespace = {}
-      for attribute_name, attribute_value in self.__dict__.items():
-        # Not using startswith to improve performance.
-        if attribute_value is not None and (
-            attribute_name[0] != '_' or
-            attribute_name in self._SERIALIZABLE_PROTECTED_ATTRIBUTES):
-          if isinstance(attribute_value, AttributeContainerIdentifier):
-            attribute_value = attribute_value.CopyToString()
+    if not expression:
+      return True
+
+    namespace = _AttributeValuesNamespace(self)
 
-          namespace[attribute_name] = attribute_value
+    try:
+      if isinstance(expression, str):
+        expression = _CompileExpression(expression)
 
-      # Make sure __builtins__ contains an empty dictionary.
-      namespace['__builtins__'] = {}
+      if callable(expression):
+        return expression(namespace)
 
-      try:
-        result = eval(expression, namespace)  # pylint: disable=eval-used
-      except Exception:  # pylint: disable=broad-except
-        pass
+      # A new globals dictionary is used for every evaluation, where
+      # __builtins__ is empty so that no builtins are available and changes
+      # made by an expression do not affect other evaluations.
+      return eval(  # pylint: disable=eval-used
+          expression, {'__builtins__': {}}, namespace)
 
-    return result
+    except Exception:  # pylint: disable=broad-except
+      return False
 
   def SetIdentifier(self, identifier):
     """Sets the identifier.
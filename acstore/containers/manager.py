@@ -1,6 +1,13 @@
 # -*- coding: utf-8 -*-
 """This file contains the attribute container manager class."""
 
+import sys
+import types
+
+
+# Read-only schema of attribute containers without a schema.
+_EMPTY_SCHEMA = types.MappingProxyType({})
+
 
 class AttributeContainersManager(object):
   """Class that implements the attribute container manager."""
@@ -41,7 +48,13 @@ class AttributeContainersManager(object):
       KeyError: if attribute container class is not set for the corresponding
           container type.
     """
-    container_type = attribute_container_class.CONTAINER_TYPE.lower()
+    # The lower case container type is cached on the class on registration.
+    # The class dictionary is used to prevent an inherited value being used.
+    container_type = attribute_container_class.__dict__.get(
+        '_CONTAINER_TYPE_LOWER', None)
+    if container_type is None:
+      container_type = attribute_container_class.CONTAINER_TYPE.lower()
+
     if container_type not in cls._attribute_container_classes:
       raise KeyError((
           f'Attribute container class not set for container type: '
@@ -54,9 +67,10 @@ class AttributeContainersManager(object):
     """Retrieves the container types of the registered attribute containers.
 
     Returns:
-      list[str]: container types.
+      KeysView[str]: container types. Note that the view reflects changes
+          in the registered attribute containers.
     """
-    return list(cls._attribute_container_classes.keys())
+    return cls._attribute_container_classes.keys()
 
   @classmethod
   def GetSchema(cls, container_type):
@@ -66,8 +80,8 @@ class AttributeContainersManager(object):
       container_type (str): attribute container type.
 
     Returns:
-      dict[str, str]: attribute container schema or an empty dictionary if
-          no schema available.
+      dict[str, str]: attribute container schema or an empty read-only
+          mapping if no schema available.
 
     Raises:
       ValueError: if the container type is not supported.
@@ -77,14 +91,15 @@ class AttributeContainersManager(object):
     if not container_class:
       raise ValueError(f'Unsupported container type: {container_type:s}')
 
-    return getattr(container_class, 'SCHEMA', {})
+    return getattr(container_class, 'SCHEMA', _EMPTY_SCHEMA)
 
   @classmethod
   def RegisterAttributeContainer(cls, attribute_container_class):
     """Registers a attribute container class.
 
     The attribute container classes are identified based on their lower case
-    container type.
+    container type. The container type, which must be a str, is interned so
+    that all references to it share the same string object.
 
     Args:
       attribute_container_class (type): attribute container class.
@@ -93,12 +108,17 @@ class AttributeContainersManager(object):
       KeyError: if attribute container class is already set for the
           corresponding container type.
     """
-    container_type = attribute_container_class.CONTAINER_TYPE.lower()
+    container_type = sys.intern(
+        attribute_container_class.CONTAINER_TYPE.lower())
     if container_type in cls._attribute_container_classes:
       raise KeyError((
           f'Attribute container class already set for container type: '
           f'{attribute_container_class.CONTAINER_TYPE:s}.'))
 
+    attribute_container_class.CONTAINER_TYPE = sys.intern(
+        attribute_container_class.CONTAINER_TYPE)
+    attribute_container_class._CONTAINER_TYPE_LOWER = container_type  # pylint: disable=protected-access
+
     cls._attribute_container_classes[container_type] = attribute_container_class
 
   @classmethod
@@ -111,9 +131,32 @@ class AttributeContainersManager(object):
     Args:
       attribute_container_classes (list[type]): attribute container classes.
 
+    None of the attribute container classes are registered if one of them
+    conflicts with a registered attribute container class or another class
+    in attribute_container_classes.
+
     Raises:
       KeyError: if attribute container class is already set for the
           corresponding container type.
     """
+    attribute_container_classes_per_type = {}
     for attribute_container_class in attribute_container_classes:
-      cls.RegisterAttributeContainer(attribute_container_class)
+      container_type = sys.intern(
+          attribute_container_class.CONTAINER_TYPE.lower())
+      if (container_type in cls._attribute_container_classes or
+          container_type in attribute_container_classes_per_type):
+        raise KeyError((
+            f'Attribute container class already set for container type: '
+            f'{attribute_container_class.CONTAINER_TYPE:s}.'))
+
+      attribute_container_classes_per_type[container_type] = (
+          attribute_container_class)
+
+    for container_type, attribute_container_class in (
+        attribute_container_classes_per_type.items()):
+      attribute_container_class.CONTAINER_TYPE = sys.intern(
+          attribute_container_class.CONTAINER_TYPE)
+      attribute_container_class._CONTAINER_TYPE_LOWER = container_type  # pylint: disable=protected-access
+
+    cls._attribute_container_classes.update(
+        attribute_container_classes_per_type)
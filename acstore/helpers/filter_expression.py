@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+"""Filter expression helper."""
+
+import ast
+import operator
+import sys
+
+
+_COMPARE_OPERATORS = {
+    ast.Eq: operator.eq,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.In: lambda left, right: left in right,
+    ast.Is: operator.is_,
+    ast.IsNot: operator.is_not,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.NotEq: operator.ne,
+    ast.NotIn: lambda left, right: left not in right}
+
+_CONSTANT_VALUE_GETTERS = {
+    ast.Constant: operator.attrgetter('value')}
+
+if sys.version_info[0:2] < (3, 8):
+  # Python 3.7 parses constants as ast.Bytes, ast.NameConstant, ast.Num and
+  # ast.Str nodes.
+  _CONSTANT_VALUE_GETTERS[ast.Bytes] = operator.attrgetter('s')
+  _CONSTANT_VALUE_GETTERS[ast.NameConstant] = operator.attrgetter('value')
+  _CONSTANT_VALUE_GETTERS[ast.Num] = operator.attrgetter('n')
+  _CONSTANT_VALUE_GETTERS[ast.Str] = operator.attrgetter('s')
+
+_SEQUENCE_TYPES = {
+    ast.List: list,
+    ast.Set: set,
+    ast.Tuple: tuple}
+
+_UNARY_OPERATORS = {
+    ast.Not: operator.not_,
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg}
+
+
+def _CompileBoolOp(ast_node):
+  """Compiles a boolean operation node.
+
+  Args:
+    ast_node (ast.BoolOp): boolean operation node.
+
+  Returns:
+    function: function that evaluates the node against a namespace.
+
+  Raises:
+    TypeError: if the type of node is not supported.
+  """
+  functions = [_CompileNode(ast_node_value) for ast_node_value in (
+      ast_node.values)]
+
+  if isinstance(ast_node.op, ast.And):
+    def _EvaluateAnd(namespace):
+      for function in functions:
+        result = function(namespace)
+        if not result:
+          break
+      return result
+
+    return _EvaluateAnd
+
+  if isinstance(ast_node.op, ast.Or):
+    def _EvaluateOr(namespace):
+      for function in functions:
+        result = function(namespace)
+        if result:
+          break
+      return result
+
+    return _EvaluateOr
+
+  raise TypeError(ast_node)
+
+
+def _CompileCompare(ast_node):
+  """Compiles a compare node.
+
+  Args:
+    ast_node (ast.Compare): compare node.
+
+  Returns:
+    function: function that evaluates the node against a namespace.
+
+  Raises:
+    TypeError: if the type of node is not supported.
+  """
+  left_function = _CompileNode(ast_node.left)
+
+  comparisons = []
+  for ast_node_operator, ast_node_comparator in zip(
+      ast_node.ops, ast_node.comparators):
+    compare_operator = _COMPARE_OPERATORS.get(type(ast_node_operator), None)
+    if not compare_operator:
+      raise TypeError(ast_node)
+
+    comparisons.append((compare_operator, _CompileNode(ast_node_comparator)))
+
+  if len(comparisons) == 1:
+    compare_operator, right_function = comparisons[0]
+
+    def _EvaluateCompare(namespace):
+      return compare_operator(
+          left_function(namespace), right_function(namespace))
+
+    return _EvaluateCompare
+
+  def _EvaluateChainedCompare(namespace):
+    left_value = left_function(namespace)
+    for compare_operator, right_function in comparisons:
+      right_value = right_function(namespace)
+      result = compare_operator(left_value, right_value)
+      if not result:
+        break
+      left_value = right_value
+    return result
+
+  return _EvaluateChainedCompare
+
+
+def _CompileNode(ast_node):
+  """Compiles a node of a Python AST.
+
+  Args:
+    ast_node (ast.Node): node of the Python AST.
+
+  Returns:
+    function: function that evaluates the node against a namespace.
+
+  Raises:
+    TypeError: if the type of node is not supported.
+  """
+  if isinstance(ast_node, ast.BoolOp):
+    return _CompileBoolOp(ast_node)
+
+  if isinstance(ast_node, ast.Compare):
+    return _CompileCompare(ast_node)
+
+  constant_value_getter = _CONSTANT_VALUE_GETTERS.get(type(ast_node), None)
+  if constant_value_getter:
+    value = constant_value_getter(ast_node)
+    return lambda namespace: value
+
+  if isinstance(ast_node, ast.Name):
+    name = ast_node.id
+    return lambda namespace: namespace[name]
+
+  sequence_type = _SEQUENCE_TYPES.get(type(ast_node), None)
+  if sequence_type:
+    functions = [_CompileNode(ast_node_element) for ast_node_element in (
+        ast_node.elts)]
+    return lambda namespace: sequence_type(
+        function(namespace) for function in functions)
+
+  if isinstance(ast_node, ast.UnaryOp):
+    unary_operator = _UNARY_OPERATORS.get(type(ast_node.op), None)
+    if not unary_operator:
+      raise TypeError(ast_node)
+
+    operand_function = _CompileNode(ast_node.operand)
+    return lambda namespace: unary_operator(operand_function(namespace))
+
+  raise TypeError(ast_node)
+
+
+def CompileFilterExpression(expression):
+  """Compiles a filter expression into a predicate.
+
+  Supported are boolean operations (and, or, not), comparisons (==, !=, <,
+  <=, >, >=, in, not in, is, is not), constants, names and list, set and
+  tuple literals.
+
+  Args:
+    expression (str): filter expression.
+
+  Returns:
+    function: predicate that takes a namespace of attribute values per name
+        and returns the result of the expression. A KeyError is raised by
+        the predicate if a name is not defined in the namespace.
+
+  Raises:
+    SyntaxError: if the expression is not a valid Python expression.
+    TypeError: if the expression contains unsupported syntax.
+  """
+  expression_ast = ast.parse(expression, mode='eval')
+  return _CompileNode(expression_ast.body)
@@ -3,6 +3,7 @@
 
 import abc
 import collections
+import contextlib
 
 from acstore.containers import manager as containers_manager
 
@@ -33,6 +34,22 @@ class AttributeSerializer(object):
     """
 
 
+# Timing context used when no storage profiler is set.
+_NULL_TIMING_CONTEXT = contextlib.nullcontext()
+
+
+def _NullTimeSection(unused_profile_name):
+  """Retrieves a timing context that does not time.
+
+  Args:
+    unused_profile_name (str): name of the profile to sample.
+
+  Returns:
+    contextlib.nullcontext: timing context.
+  """
+  return _NULL_TIMING_CONTEXT
+
+
 class AttributeContainerStore(object):
   """Interface of an attribute container store.
 
@@ -46,6 +63,7 @@ class AttributeContainerStore(object):
     self._attribute_container_sequence_numbers = collections.Counter()
     self._containers_manager = containers_manager.AttributeContainersManager
     self._storage_profiler = None
+    self._storage_timer = _NullTimeSection
 
     self.format_version = None
 
@@ -226,6 +244,11 @@ class AttributeContainerStore(object):
     """
     self._storage_profiler = storage_profiler
 
+    if storage_profiler:
+      self._storage_timer = storage_profiler.TimeSection
+    else:
+      self._storage_timer = _NullTimeSection
+
   def UpdateAttributeContainer(self, container):
     """Updates an existing attribute container.
 
@@ -2,6 +2,7 @@
 """The profiler classes."""
 
 import codecs
+import contextlib
 import gzip
 import os
 import time
@@ -102,6 +103,22 @@ class StorageProfiler(object):
         f'{sample_time:f}\t{profile_name:s}\t{operation:s}\t{description:s}\t'
         f'{processing_time:f}\t{data_size:d}\t{compressed_data_size:d}\n'))
 
+  @contextlib.contextmanager
+  def TimeSection(self, profile_name):
+    """Times the CPU time of a section of code.
+
+    Args:
+      profile_name (str): name of the profile to sample.
+
+    Yields:
+      None: the section of code is timed while the context is active.
+    """
+    self.StartTiming(profile_name)
+    try:
+      yield
+    finally:
+      self.StopTiming(profile_name)
+
   def Start(self):
     """Starts the profiler."""
     filename = f'{self._FILENAME_PREFIX:s}-{self._identifier:s}.csv.gz'
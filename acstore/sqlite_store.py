@@ -3,16 +3,111 @@
 
 import ast
 import collections
-import itertools
+import functools
+import operator
 import os
 import pathlib
 import sqlite3
+import sys
 
 from acstore import interface
 from acstore.containers import interface as containers_interface
 from acstore.helpers import schema as schema_helper
 
 
+def _BoolOp2SQL(ast_node):
+  """Converts a Python AST boolean operation node to SQL.
+
+  Args:
+    ast_node (ast.BoolOp): boolean operation node of the Python AST.
+
+  Returns:
+    str: SQL statement that represents the node.
+
+  Raises:
+    TypeError: if the type of node is not supported.
+  """
+  if isinstance(ast_node.op, ast.And):
+    operand = ' AND '
+  elif isinstance(ast_node.op, ast.Or):
+    operand = ' OR '
+  else:
+    raise TypeError(ast_node)
+
+  return operand.join([
+      PythonAST2SQL(ast_node_value) for ast_node_value in ast_node.values])
+
+
+def _Compare2SQL(ast_node):
+  """Converts a Python AST compare node to SQL.
+
+  Args:
+    ast_node (ast.Compare): compare node of the Python AST.
+
+  Returns:
+    str: SQL statement that represents the node.
+
+  Raises:
+    TypeError: if the type of node is not supported.
+  """
+  if len(ast_node.ops) != 1:
+    raise TypeError(ast_node)
+
+  if isinstance(ast_node.ops[0], ast.Eq):
+    sql_operator = ' = '
+  elif isinstance(ast_node.ops[0], ast.NotEq):
+    sql_operator = ' <> '
+  else:
+    raise TypeError(ast_node)
+
+  if len(ast_node.comparators) != 1:
+    raise TypeError(ast_node)
+
+  sql_left = PythonAST2SQL(ast_node.left)
+  sql_right = PythonAST2SQL(ast_node.comparators[0])
+
+  return sql_operator.join([sql_left, sql_right])
+
+
+def _Constant2SQL(ast_node):
+  """Converts a Python AST constant node to SQL.
+
+  Args:
+    ast_node (ast.Constant): constant node of the Python AST.
+
+  Returns:
+    str: SQL statement that represents the node.
+  """
+  if isinstance(ast_node.value, str):
+    return f'"{ast_node.value:s}"'
+
+  return str(ast_node.value)
+
+
+def _Name2SQL(ast_node):
+  """Converts a Python AST name node to SQL.
+
+  Args:
+    ast_node (ast.Name): name node of the Python AST.
+
+  Returns:
+    str: SQL statement that represents the node.
+  """
+  return ast_node.id
+
+
+_AST2SQL_FUNCTIONS = {
+    ast.BoolOp: _BoolOp2SQL,
+    ast.Compare: _Compare2SQL,
+    ast.Constant: _Constant2SQL,
+    ast.Name: _Name2SQL}
+
+if sys.version_info[0:2] < (3, 8):
+  # Python 3.7 parses constants as ast.Num and ast.Str nodes.
+  _AST2SQL_FUNCTIONS[ast.Num] = lambda ast_node: str(ast_node.n)
+  _AST2SQL_FUNCTIONS[ast.Str] = lambda ast_node: f'"{ast_node.s:s}"'
+
+
 def PythonAST2SQL(ast_node):
   """Converts a Python AST to SQL.
 
@@ -25,52 +120,61 @@ def PythonAST2SQL(ast_node):
   Raises:
     TypeError: if the type of node is not supported.
   """
-  if isinstance(ast_node, ast.BoolOp):
-    if isinstance(ast_node.op, ast.And):
-      operand = ' AND '
-    elif isinstance(ast_node.op, ast.Or):
-      operand = ' OR '
-    else:
-      raise TypeError(ast_node)
+  ast2sql_function = _AST2SQL_FUNCTIONS.get(type(ast_node), None)
+  if not ast2sql_function:
+    raise TypeError(ast_node)
 
-    return operand.join([
-        PythonAST2SQL(ast_node_value) for ast_node_value in ast_node.values])
+  return ast2sql_function(ast_node)
 
-  if isinstance(ast_node, ast.Compare):
-    if len(ast_node.ops) != 1:
-      raise TypeError(ast_node)
 
-    if isinstance(ast_node.ops[0], ast.Eq):
-      operator = ' = '
-    elif isinstance(ast_node.ops[0], ast.NotEq):
-      operator = ' <> '
-    else:
-      raise TypeError(ast_node)
+@functools.lru_cache(maxsize=256)
+def PythonExpression2SQL(expression):
+  """Converts a Python expression to SQL.
+
+  Results are cached since the same filter expression is typically used
+  many times.
+
+  Args:
+    expression (str): Python expression.
+
+  Returns:
+    str: SQL statement that represents the expression.
+
+  Raises:
+    SyntaxError: if the expression is not a valid Python expression.
+    TypeError: if the expression contains unsupported syntax.
+  """
+  expression_ast = ast.parse(expression, mode='eval')
+  return PythonAST2SQL(expression_ast.body)
 
-    if len(ast_node.comparators) != 1:
-      raise TypeError(ast_node)
 
-    sql_left = PythonAST2SQL(ast_node.left)
-    sql_right = PythonAST2SQL(ast_node.comparators[0])
+def _DeserializeAttributeContainerIdentifier(value):
+  """Deserializes an attribute container identifier.
 
-    return operator.join([sql_left, sql_right])
+  Args:
+    value (str): string representation of the identifier.
 
-  if isinstance(ast_node, ast.Constant):
-    if isinstance(ast_node.value, str):
-      return f'"{ast_node.value:s}"'
+  Returns:
+    AttributeContainerIdentifier: attribute container identifier.
+  """
+  identifier = containers_interface.AttributeContainerIdentifier()
+  identifier.CopyFromString(value)
+  return identifier
 
-    return str(ast_node.value)
 
-  if isinstance(ast_node, ast.Name):
-    return ast_node.id
+def _SerializeAttributeContainerIdentifier(value):
+  """Serializes an attribute container identifier.
 
-  if isinstance(ast_node, ast.Num):
-    return str(ast_node.n)
+  Args:
+    value (AttributeContainerIdentifier|str): attribute container identifier.
 
-  if isinstance(ast_node, ast.Str):
-    return f'"{ast_node.s:s}"'
+  Returns:
+    str: string representation of the identifier.
+  """
+  if isinstance(value, containers_interface.AttributeContainerIdentifier):
+    value = value.CopyToString()
 
-  raise TypeError(ast_node)
+  return value
 
 
 class SQLiteSchemaHelper(object):
@@ -103,6 +207,26 @@ class SQLiteSchemaHelper(object):
     Returns:
       object: runtime value.
 
+    Raises:
+      IOError: if the schema data type is not supported.
+      OSError: if the schema data type is not supported.
+    """
+    deserialize_function = self.GetDeserializeValueFunction(data_type)
+    if value is not None and deserialize_function:
+      value = deserialize_function(value)
+
+    return value
+
+  def GetDeserializeValueFunction(self, data_type):
+    """Retrieves the function to deserialize values of a specific data type.
+
+    Args:
+      data_type (str): schema data type.
+
+    Returns:
+      function: function to deserialize a value that is not None or None if
+          values of the data type are stored as-is.
+
     Raises:
       IOError: if the schema data type is not supported.
       OSError: if the schema data type is not supported.
@@ -110,31 +234,28 @@ class SQLiteSchemaHelper(object):
     if not schema_helper.SchemaHelper.HasDataType(data_type):
       raise IOError(f'Unsupported data type: {data_type:s}')
 
-    if value is not None:
-      if data_type == 'AttributeContainerIdentifier':
-        identifier = containers_interface.AttributeContainerIdentifier()
-        identifier.CopyFromString(value)
-        value = identifier
+    if data_type == 'AttributeContainerIdentifier':
+      return _DeserializeAttributeContainerIdentifier
 
-      elif data_type == 'bool':
-        value = bool(value)
+    if data_type == 'bool':
+      return bool
 
-      elif data_type not in self._MAPPINGS:
-        serializer = schema_helper.SchemaHelper.GetAttributeSerializer(
-            data_type, 'json')
-        value = serializer.DeserializeValue(value)
+    if data_type in self._MAPPINGS:
+      return None
 
-    return value
+    serializer = schema_helper.SchemaHelper.GetAttributeSerializer(
+        data_type, 'json')
+    return serializer.DeserializeValue
 
-  def SerializeValue(self, data_type, value):
-    """Serializes a value.
+  def GetSerializeValueFunction(self, data_type):
+    """Retrieves the function to serialize values of a specific data type.
 
     Args:
       data_type (str): schema data type.
-      value (object): runtime value.
 
     Returns:
-      object: serialized value.
+      function: function to serialize a value that is not None or None if
+          values of the data type are stored as-is.
 
     Raises:
       IOError: if the schema data type is not supported.
@@ -143,24 +264,45 @@ class SQLiteSchemaHelper(object):
     if not schema_helper.SchemaHelper.HasDataType(data_type):
       raise IOError(f'Unsupported data type: {data_type:s}')
 
-    if value is not None:
-      if data_type == 'AttributeContainerIdentifier' and isinstance(
-          value, containers_interface.AttributeContainerIdentifier):
-        value = value.CopyToString()
+    if data_type == 'AttributeContainerIdentifier':
+      return _SerializeAttributeContainerIdentifier
 
-      elif data_type == 'bool':
-        value = int(value)
+    if data_type == 'bool':
+      return int
 
-      elif data_type not in self._MAPPINGS:
-        serializer = schema_helper.SchemaHelper.GetAttributeSerializer(
-            data_type, 'json')
+    if data_type in self._MAPPINGS:
+      return None
 
-        # JSON will not serialize certain runtime types like set, therefore
-        # these are cast to list first.
-        if isinstance(value, set):
-          value = list(value)
+    serializer = schema_helper.SchemaHelper.GetAttributeSerializer(
+        data_type, 'json')
 
-        return serializer.SerializeValue(value)
+    def _SerializeValue(value):
+      # JSON will not serialize certain runtime types like set, therefore
+      # these are cast to list first.
+      if isinstance(value, set):
+        value = list(value)
+
+      return serializer.SerializeValue(value)
+
+    return _SerializeValue
+
+  def SerializeValue(self, data_type, value):
+    """Serializes a value.
+
+    Args:
+      data_type (str): schema data type.
+      value (object): runtime value.
+
+    Returns:
+      object: serialized value.
+
+    Raises:
+      IOError: if the schema data type is not supported.
+      OSError: if the schema data type is not supported.
+    """
+    serialize_function = self.GetSerializeValueFunction(data_type)
+    if value is not None and serialize_function:
+      value = serialize_function(value)
 
     return value
 
@@ -198,27 +340,85 @@ class SQLiteAttributeContainerStore(interface.AttributeContainerStore):
   _CREATE_METADATA_TABLE_QUERY = (
       'CREATE TABLE metadata (key TEXT, value TEXT);')
 
-  _HAS_TABLE_QUERY = (
-      'SELECT name FROM sqlite_master '
-      'WHERE type = "table" AND name = "{0:s}"')
+  _FILE_SIGNATURE = b'SQLite format 3\x00'
+
+  _GET_SEQUENCE_NUMBERS_QUERY = 'SELECT name, seq FROM sqlite_sequence'
+
+  _GET_TABLE_NAMES_QUERY = (
+      'SELECT name FROM sqlite_master WHERE type = "table"')
 
   _INSERT_METADATA_VALUE_QUERY = (
       'INSERT INTO metadata (key, value) VALUES (?, ?)')
 
+  _JOURNAL_MODES = frozenset([
+      'DELETE', 'MEMORY', 'OFF', 'PERSIST', 'TRUNCATE', 'WAL'])
+
+  _SYNCHRONOUS_MODES = frozenset(['EXTRA', 'FULL', 'NORMAL', 'OFF'])
+
+  _UPDATE_METADATA_VALUE_QUERY = (
+      'UPDATE metadata SET value = ? WHERE key = ?')
+
   # The maximum number of cached attribute containers
   _MAXIMUM_CACHED_CONTAINERS = 32 * 1024
 
-  _MAXIMUM_WRITE_CACHE_SIZE = 50
+  # The maximum number of rows fetched at once.
+  _MAXIMUM_FETCH_SIZE = 256
+
+  # The maximum number of attribute containers retrieved at once by index
+  # when they are retrieved by consecutive indexes.
+  _MAXIMUM_PREFETCH_SIZE = 64
+
+  # The maximum number of rows retrieved per page when iterating a table.
+  _MAXIMUM_PAGE_SIZE = 4096
+
+  # The maximum number of prepared statements cached by the connection.
+  _MAXIMUM_CACHED_STATEMENTS = 256
+
+  # The maximum number of attribute containers cached for writing per type.
+  _MAXIMUM_WRITE_CACHE_SIZE = 1000
+
+  # The maximum number of values cached for writing per type, which bounds
+  # how large the write cache grows and how much is written per flush.
+  _MAXIMUM_WRITE_CACHE_VALUES = 32000
 
-  def __init__(self):
-    """Initializes a SQLite attribute container store."""
+  # The number of WAL pages after which the WAL file is checkpointed.
+  _WAL_AUTOCHECKPOINT = 10000
+
+  def __init__(self, cache_size=-65536, mmap_size=10 * 1024 * 1024 * 1024):
+    """Initializes a SQLite attribute container store.
+
+    Args:
+      cache_size (Optional[int]): maximum size of the SQLite page cache, where
+          a negative value is in KiB, such as -65536 for 64 MiB, and a positive
+          value is in pages.
+      mmap_size (Optional[int]): maximum number of bytes of the database
+          file that SQLite maps into memory, where 0 disables memory-mapped
+          I/O.
+    """
     super(SQLiteAttributeContainerStore, self).__init__()
+    self._cache_size = cache_size
+    self._mmap_size = mmap_size
     self._attribute_container_cache = collections.OrderedDict()
+    self._attribute_values_getters = {}
+    self._columns = {}
     self._connection = None
     self._cursor = None
+    self._deserializers = {}
+    self._insert_queries = {}
     self._is_open = False
+    self._journal_mode = None
+    self._last_cached_lookup_key = None
+    self._last_retrieved_index_key = None
+    self._maximum_write_cache_sizes = {}
     self._read_only = True
     self._schema_helper = SQLiteSchemaHelper()
+    self._select_by_index_queries = {}
+    self._select_queries = {}
+    self._serializers = {}
+    self._sorted_schemas = {}
+    self._table_names = None
+    self._update_cache = {}
+    self._update_queries = {}
     self._write_cache = {}
 
     self.format_version = self._FORMAT_VERSION
@@ -231,30 +431,48 @@ class SQLiteAttributeContainerStore(interface.AttributeContainerStore):
       attribute_container (AttributeContainer): attribute container.
       index (int): attribute container index.
     """
+    # The most recently used attribute containers are stored at the end of
+    # the cache, hence the least recently used attribute container is evicted
+    # from the start.
     if len(self._attribute_container_cache) >= self._MAXIMUM_CACHED_CONTAINERS:
-      self._attribute_container_cache.popitem(last=True)
+      self._attribute_container_cache.popitem(last=False)
 
-    lookup_key = f'{attribute_container.CONTAINER_TYPE:s}.{index:d}'
+    lookup_key = (attribute_container.CONTAINER_TYPE, index)
     self._attribute_container_cache[lookup_key] = attribute_container
-    self._attribute_container_cache.move_to_end(lookup_key, last=False)
+    self._attribute_container_cache.move_to_end(lookup_key, last=True)
+    self._last_cached_lookup_key = lookup_key
 
-  def _CacheAttributeContainerForWrite(
-      self, container_type, column_names, values):
+  def _CacheAttributeContainerForWrite(self, container_type, values):
     """Caches an attribute container for writing.
 
     Args:
       container_type (str): attribute container type.
-      column_names (list[str]): names of the columns.
-      values (list[str]): values for each of the colums.
+      values (list[object]): values for each of the colums.
     """
-    write_cache = self._write_cache.get(container_type, [column_names])
+    write_cache = self._write_cache.setdefault(container_type, [])
     write_cache.append(values)
 
-    if len(write_cache) >= self._MAXIMUM_WRITE_CACHE_SIZE:
+    if len(write_cache) >= self._GetMaximumWriteCacheSize(container_type):
       self._FlushWriteCache(container_type, write_cache)
-      write_cache = [column_names]
+      self._write_cache[container_type] = []
 
-    self._write_cache[container_type] = write_cache
+  def _BeginTransaction(self):
+    """Begins a transaction if none is active.
+
+    Changes are written in a single transaction that is committed when the
+    store is flushed.
+
+    Raises:
+      IOError: when there is an error querying the attribute container store.
+      OSError: when there is an error querying the attribute container store.
+    """
+    if not self._connection.in_transaction:
+      try:
+        self._cursor.execute('BEGIN')
+      except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+        raise IOError((
+            f'Unable to query attribute container store with error: '
+            f'{exception!s}'))
 
   def _CheckStorageMetadata(self, metadata_values, check_readable_only=False):
     """Checks the storage metadata.
@@ -274,10 +492,13 @@ class SQLiteAttributeContainerStore(interface.AttributeContainerStore):
     if not format_version:
       raise IOError('Missing format version.')
 
-    try:
-      format_version = int(format_version, 10)
-    except (TypeError, ValueError):
-      raise IOError(f'Invalid format version: {format_version!s}.')
+    # The format version is an integer if the metadata values were already
+    # checked before.
+    if not isinstance(format_version, int):
+      try:
+        format_version = int(format_version, 10)
+      except (TypeError, ValueError):
+        raise IOError(f'Invalid format version: {format_version!s}.')
 
     if (not check_readable_only and
         format_version < self._APPEND_COMPATIBLE_FORMAT_VERSION):
@@ -295,7 +516,7 @@ class SQLiteAttributeContainerStore(interface.AttributeContainerStore):
     if format_version > self._FORMAT_VERSION:
       raise IOError((
           f'Format version: {format_version:d} is too new and not yet '
-          f'supported, minimum supported version: '
+          f'supported, maximum supported version: '
           f'{self._FORMAT_VERSION:d}.'))
 
     serialization_format = metadata_values.get('serialization_format', None)
@@ -312,10 +533,15 @@ class SQLiteAttributeContainerStore(interface.AttributeContainerStore):
     Args:
       container_type (str): attribute container type.
     """
-    write_cache = self._write_cache.get(container_type, [])
-    if len(write_cache) > 1:
+    write_cache = self._write_cache.pop(container_type, None)
+    if write_cache:
       self._FlushWriteCache(container_type, write_cache)
-      del self._write_cache[container_type]
+
+    # Updates are flushed after the new attribute containers so that updates
+    # of attribute containers that were still cached for writing are stored.
+    update_cache = self._update_cache.pop(container_type, None)
+    if update_cache:
+      self._FlushUpdateCache(container_type, update_cache)
 
   def _CreateAttributeContainerTable(self, container_type):
     """Creates a table for a specific attribute container type.
@@ -329,19 +555,19 @@ class SQLiteAttributeContainerStore(interface.AttributeContainerStore):
       OSError: when there is an error querying the attribute container store
           or if an unsupported attribute container is provided.
     """
-    schema = self._GetAttributeContainerSchema(container_type)
-    if not schema:
-      raise IOError(f'Unsupported attribute container type: {container_type:s}')
+    sorted_schema = self._GetSortedAttributeContainerSchema(container_type)
 
     column_definitions = ['_identifier INTEGER PRIMARY KEY AUTOINCREMENT']
 
-    for name, data_type in sorted(schema.items()):
+    for name, data_type in sorted_schema:
       data_type = self._schema_helper.GetStorageDataType(data_type)
       column_definitions.append(f'{name:s} {data_type:s}')
 
     column_definitions = ', '.join(column_definitions)
     query = f'CREATE TABLE {container_type:s} ({column_definitions:s});'
 
+    self._BeginTransaction()
+
     try:
       self._cursor.execute(query)
     except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
@@ -349,6 +575,9 @@ class SQLiteAttributeContainerStore(interface.AttributeContainerStore):
           f'Unable to query attribute container store with error: '
           f'{exception!s}'))
 
+    if self._table_names is not None:
+      self._table_names.add(container_type)
+
   def _CreatetAttributeContainerFromRow(
       self, container_type, column_names, row, first_column_index):
     """Creates an attribute container of a row in the database.
@@ -368,26 +597,18 @@ class SQLiteAttributeContainerStore(interface.AttributeContainerStore):
       OSError: when there is an error querying the attribute container store
           or if an unsupported attribute container is provided.
     """
-    schema = self._GetAttributeContainerSchema(container_type)
-    if not schema:
-      raise IOError(f'Unsupported attribute container type: {container_type:s}')
+    deserializers = self._GetAttributeContainerDeserializers(container_type)
 
     container = self._containers_manager.CreateAttributeContainer(
         container_type)
 
-    for column_index, name in enumerate(column_names):
-      row_value = row[first_column_index + column_index]
+    for name, row_value in zip(column_names, row[first_column_index:]):
       if row_value is not None:
-        data_type = schema[name]
-        try:
-          attribute_value = self._schema_helper.DeserializeValue(
-              data_type, row_value)
-        except IOError:
-          raise IOError((
-              f'Unsupported attribute container type: {container_type:s} '
-              f'attribute: {name:s} data type: {data_type:s}'))
+        deserialize_function = deserializers[name]
+        if deserialize_function:
+          row_value = deserialize_function(row_value)
 
-        setattr(container, name, attribute_value)
+        setattr(container, name, row_value)
 
     return container
 
@@ -398,52 +619,238 @@ class SQLiteAttributeContainerStore(interface.AttributeContainerStore):
       IOError: when there is an error querying the attribute container store.
       OSError: when there is an error querying the attribute container store.
     """
-    for container_type, write_cache in self._write_cache.items():
-      if len(write_cache) > 1:
-        self._FlushWriteCache(container_type, write_cache)
+    if self._write_cache:
+      for container_type, write_cache in self._write_cache.items():
+        if write_cache:
+          self._FlushWriteCache(container_type, write_cache)
 
-    self._write_cache = {}
+      self._write_cache = {}
+
+    if self._update_cache:
+      for container_type, update_cache in self._update_cache.items():
+        self._FlushUpdateCache(container_type, update_cache)
 
-    # We need to run commit or not all data is stored in the database.
-    self._connection.commit()
+      self._update_cache = {}
+
+    # We need to run commit or not all data is stored in the database. A
+    # transaction is only active if data was written since the last commit,
+    # see _BeginTransaction().
+    if self._connection.in_transaction:
+      self._connection.commit()
+
+  def _FlushUpdateCache(self, container_type, update_cache):
+    """Flushes attribute container values cached for updating.
+
+    Args:
+      container_type (str): attribute container type.
+      update_cache (list[list[object]]): cached attribute container values,
+          where the last value is the sequence number of the attribute
+          container.
+
+    Raises:
+      IOError: when there is an error querying the attribute container store.
+      OSError: when there is an error querying the attribute container store.
+    """
+    query = self._update_queries[container_type]
+
+    self._BeginTransaction()
+
+    try:
+      with self._storage_timer('write_existing'):
+        self._cursor.executemany(query, update_cache)
+
+    except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+      raise IOError((
+          f'Unable to query attribute container store with error: '
+          f'{exception!s}'))
 
   def _FlushWriteCache(self, container_type, write_cache):
     """Flushes attribute container values cached for writing.
 
     Args:
       container_type (str): attribute container type.
-      write_cache (list[tuple[str]]): cached attribute container values.
+      write_cache (list[list[object]]): cached attribute container values.
 
     Raises:
       IOError: when there is an error querying the attribute container store.
       OSError: when there is an error querying the attribute container store.
     """
-    column_names = write_cache.pop(0)
+    query = self._insert_queries.get(container_type, None)
+    if not query:
+      column_names, column_names_string = self._GetAttributeContainerColumns(
+          container_type)
+      value_statement = ', '.join(['?'] * len(column_names))
 
-    value_statement = ','.join(['?'] * len(column_names))
-    value_statement = f'({value_statement:s})'
-    values_statement = ', '.join([value_statement] * len(write_cache))
+      query = (f'INSERT INTO {container_type:s} ({column_names_string:s}) '
+               f'VALUES ({value_statement:s})')
+      self._insert_queries[container_type] = query
 
-    column_names_string = ', '.join(column_names)
+    self._BeginTransaction()
 
-    query = (f'INSERT INTO {container_type:s} ({column_names_string:s}) '
-             f'VALUES {values_statement:s}')
+    try:
+      with self._storage_timer('write_new'):
+        self._cursor.executemany(query, write_cache)
 
-    if self._storage_profiler:
-      self._storage_profiler.StartTiming('write_new')
+    except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+      raise IOError((
+          f'Unable to query attribute container store with error: '
+          f'{exception!s}'))
 
-    try:
-      values = list(itertools.chain(*write_cache))
-      self._cursor.execute(query, values)
+  def _GetAttributeContainerColumns(self, container_type):
+    """Retrieves the columns of an attribute container table.
+
+    Args:
+      container_type (str): attribute container type.
 
+    Returns:
+      tuple[tuple[str], str]: names of the columns, sorted by name, and the
+          names of the columns as a comma separated string.
+
+    Raises:
+      IOError: if an unsupported attribute container is provided.
+      OSError: if an unsupported attribute container is provided.
+    """
+    columns = self._columns.get(container_type, None)
+    if columns is None:
+      sorted_schema = self._GetSortedAttributeContainerSchema(container_type)
+
+      column_names = tuple(name for name, _ in sorted_schema)
+      columns = (column_names, ', '.join(column_names))
+      self._columns[container_type] = columns
+
+    return columns
+
+  def _GetAttributeContainerDeserializers(self, container_type):
+    """Retrieves the functions to deserialize attribute values.
+
+    Args:
+      container_type (str): attribute container type.
+
+    Returns:
+      dict[str, function]: function to deserialize the attribute value, or
+          None if the value is stored as-is, per attribute name.
+
+    Raises:
+      IOError: if an unsupported attribute container is provided.
+      OSError: if an unsupported attribute container is provided.
+    """
+    deserializers = self._deserializers.get(container_type, None)
+    if deserializers is None:
+      deserializers = {}
+      for name, data_type in self._GetSortedAttributeContainerSchema(
+          container_type):
+        try:
+          deserializers[name] = self._schema_helper.GetDeserializeValueFunction(
+              data_type)
+        except IOError:
+          raise IOError((
+              f'Unsupported attribute container type: {container_type:s} '
+              f'attribute: {name:s} data type: {data_type:s}'))
+
+      self._deserializers[container_type] = deserializers
+
+    return deserializers
+
+  def _GetAttributeContainerSerializers(self, container_type):
+    """Retrieves the functions to serialize attribute values.
+
+    Args:
+      container_type (str): attribute container type.
+
+    Returns:
+      tuple[tuple[str, function]]: name of the attribute and function to
+          serialize its value, or None if the value is stored as-is, sorted by
+          name.
+
+    Raises:
+      IOError: if an unsupported attribute container is provided.
+      OSError: if an unsupported attribute container is provided.
+    """
+    serializers = self._serializers.get(container_type, None)
+    if serializers is None:
+      serializers = []
+      for name, data_type in self._GetSortedAttributeContainerSchema(
+          container_type):
+        try:
+          serialize_function = self._schema_helper.GetSerializeValueFunction(
+              data_type)
+        except IOError:
+          raise IOError((
+              f'Unsupported attribute container type: {container_type:s} '
+              f'attribute: {name:s} data type: {data_type:s}'))
+
+        serializers.append((name, serialize_function))
+
+      serializers = tuple(serializers)
+      self._serializers[container_type] = serializers
+
+    return serializers
+
+  def _GetAttributeContainersByIndexRange(
+      self, container_type, first_index, last_index):
+    """Retrieves a range of attribute containers by index.
+
+    The attribute containers are cached, except for those that were already
+    cached, which are not retrieved again.
+
+    Args:
+      container_type (str): attribute container type.
+      first_index (int): index of the first attribute container.
+      last_index (int): index of the last attribute container.
+
+    Returns:
+      list[AttributeContainer]: attribute containers that were retrieved and
+          not already cached, sorted by index.
+
+    Raises:
+      IOError: when there is an error querying the attribute container store
+          or if an unsupported attribute container is provided.
+      OSError: when there is an error querying the attribute container store
+          or if an unsupported attribute container is provided.
+    """
+    column_names, column_names_string = self._GetAttributeContainerColumns(
+        container_type)
+
+    # The query uses parameters for the row numbers so that the same prepared
+    # statement is used for every range.
+    query = self._select_by_index_queries.get(container_type, None)
+    if not query:
+      query = (f'SELECT rowid, {column_names_string:s} FROM '
+               f'{container_type:s} WHERE rowid BETWEEN ? AND ? '
+               f'ORDER BY rowid')
+      self._select_by_index_queries[container_type] = query
+
+    try:
+      self._cursor.execute(query, (first_index + 1, last_index + 1))
     except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
       raise IOError((
           f'Unable to query attribute container store with error: '
           f'{exception!s}'))
 
-    finally:
-      if self._storage_profiler:
-        self._storage_profiler.StopTiming('write_new')
+    with self._storage_timer('get_container_by_index'):
+      rows = self._cursor.fetchall()
+
+    # Look up the functions used per row only once.
+    create_container_function = self._CreatetAttributeContainerFromRow
+    identifier_class = containers_interface.AttributeContainerIdentifier
+
+    containers = []
+    for row in rows:
+      row_number = row[0]
+      if (container_type, row_number - 1) in self._attribute_container_cache:
+        continue
+
+      container = create_container_function(
+          container_type, column_names, row, 1)
+
+      identifier = identifier_class(
+          name=container_type, sequence_number=row_number)
+      container.SetIdentifier(identifier)
+
+      self._CacheAttributeContainerByIndex(container, row_number - 1)
+      containers.append(container)
+
+    return containers
 
   def _GetAttributeContainersWithFilter(
       self, container_type, column_names=None, filter_expression=None,
@@ -463,57 +870,98 @@ class SQLiteAttributeContainerStore(interface.AttributeContainerStore):
       IOError: when there is an error querying the attribute container store.
       OSError: when there is an error querying the attribute container store.
     """
-    self._CommitWriteCache(container_type)
+    # The write cache is always empty when the store is read-only.
+    if not self._read_only:
+      self._CommitWriteCache(container_type)
 
-    if self._attribute_container_sequence_numbers[container_type]:
+    if not self._attribute_container_sequence_numbers[container_type]:
+      return
+
+    lookup_key = (
+        container_type, tuple(column_names), filter_expression, order_by)
+    query = self._select_queries.get(lookup_key, None)
+    if not query:
       column_names_string = ', '.join(column_names)
 
       query = (f'SELECT _identifier, {column_names_string:s} '
                f'FROM {container_type:s}')
-      if filter_expression:
-        query = ' WHERE '.join([query, filter_expression])
-      if order_by:
-        query = ' ORDER BY '.join([query, order_by])
 
-      # Use a local cursor to prevent another query interrupting the generator.
-      cursor = self._connection.cursor()
+      if filter_expression or order_by:
+        if filter_expression:
+          query = ' WHERE '.join([query, filter_expression])
+        if order_by:
+          query = ' ORDER BY '.join([query, order_by])
+      else:
+        query = (f'{query:s} WHERE _identifier > ? ORDER BY _identifier '
+                 f'LIMIT ?')
+
+      # Prevent the cache from growing indefinitely with distinct filter
+      # expressions.
+      if len(self._select_queries) >= self._MAXIMUM_CACHED_STATEMENTS:
+        self._select_queries.clear()
 
-      try:
-        cursor.execute(query)
-      except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
-        raise IOError((
-            f'Unable to query attribute container store for container: '
-            f'{container_type:s} with error: {exception!s}'))
+      self._select_queries[lookup_key] = query
 
-      if self._storage_profiler:
-        self._storage_profiler.StartTiming('get_containers')
+    if filter_expression or order_by:
+      rows_generator = self._GetRowsInBatches(container_type, query)
 
-      try:
-        row = cursor.fetchone()
+    else:
+      rows_generator = self._GetRowsInPages(container_type, query)
 
-      finally:
-        if self._storage_profiler:
-          self._storage_profiler.StopTiming('get_containers')
+    # Look up the functions used per row only once.
+    create_container_function = self._CreatetAttributeContainerFromRow
+    identifier_class = containers_interface.AttributeContainerIdentifier
 
-      while row:
-        container = self._CreatetAttributeContainerFromRow(
+    for rows in rows_generator:
+      for row in rows:
+        container = create_container_function(
             container_type, column_names, row, 1)
 
-        identifier = containers_interface.AttributeContainerIdentifier(
+        identifier = identifier_class(
             name=container_type, sequence_number=row[0])
         container.SetIdentifier(identifier)
 
         yield container
 
-        if self._storage_profiler:
-          self._storage_profiler.StartTiming('get_containers')
+  def _GetAttributeValuesGetter(self, container_type):
+    """Retrieves the function to get the attribute values of a container.
 
-        try:
-          row = cursor.fetchone()
+    Args:
+      container_type (str): attribute container type.
 
-        finally:
-          if self._storage_profiler:
-            self._storage_profiler.StopTiming('get_containers')
+    Returns:
+      function: function that returns a tuple of the attribute values of
+          an attribute container, sorted by attribute name, and raises
+          AttributeError if an attribute is not set.
+
+    Raises:
+      IOError: if an unsupported attribute container is provided.
+      OSError: if an unsupported attribute container is provided.
+    """
+    attribute_values_getter = self._attribute_values_getters.get(
+        container_type, None)
+    if attribute_values_getter is None:
+      column_names, _ = self._GetAttributeContainerColumns(container_type)
+
+      if len(column_names) > 1:
+        attribute_values_getter = operator.attrgetter(*column_names)
+      elif column_names:
+        attribute_getter = operator.attrgetter(column_names[0])
+
+        def _GetSingleAttributeValue(container):
+          return (attribute_getter(container),)
+
+        attribute_values_getter = _GetSingleAttributeValue
+
+      else:
+        def _GetNoAttributeValues(unused_container):
+          return ()
+
+        attribute_values_getter = _GetNoAttributeValues
+
+      self._attribute_values_getters[container_type] = attribute_values_getter
+
+    return attribute_values_getter
 
   def _GetCachedAttributeContainer(self, container_type, index):
     """Retrieves a specific cached attribute container.
@@ -529,12 +977,154 @@ class SQLiteAttributeContainerStore(interface.AttributeContainerStore):
       IOError: when there is an error querying the attribute container store.
       OSError: when there is an error querying the attribute container store.
     """
-    lookup_key = f'{container_type:s}.{index:d}'
+    lookup_key = (container_type, index)
     attribute_container = self._attribute_container_cache.get(lookup_key, None)
-    if attribute_container:
-      self._attribute_container_cache.move_to_end(lookup_key, last=False)
+    # Moving the attribute container is skipped when it already is the most
+    # recently used one.
+    if (attribute_container is not None and
+        lookup_key != self._last_cached_lookup_key):
+      self._attribute_container_cache.move_to_end(lookup_key, last=True)
+      self._last_cached_lookup_key = lookup_key
+
     return attribute_container
 
+  def _GetMaximumWriteCacheSize(self, container_type):
+    """Retrieves the maximum number of attribute containers cached for writing.
+
+    The maximum is based on the number of columns so that the size of the
+    write cache, and how much is written per flush, is bounded in number of
+    values instead of containers.
+
+    Args:
+      container_type (str): attribute container type.
+
+    Returns:
+      int: maximum number of attribute containers cached for writing.
+
+    Raises:
+      IOError: if an unsupported attribute container is provided.
+      OSError: if an unsupported attribute container is provided.
+    """
+    maximum_write_cache_size = self._maximum_write_cache_sizes.get(
+        container_type, None)
+    if maximum_write_cache_size is None:
+      column_names, _ = self._GetAttributeContainerColumns(container_type)
+      number_of_columns = max(len(column_names), 1)
+
+      maximum_write_cache_size = max(1, min(
+          self._MAXIMUM_WRITE_CACHE_SIZE,
+          self._MAXIMUM_WRITE_CACHE_VALUES // number_of_columns))
+      self._maximum_write_cache_sizes[container_type] = (
+          maximum_write_cache_size)
+
+    return maximum_write_cache_size
+
+  def _GetRowsInBatches(self, container_type, query):
+    """Retrieves the rows of a query in batches.
+
+    Args:
+      container_type (str): attribute container type.
+      query (str): SQL query.
+
+    Yields:
+      list[sqlite3.Row]: batch of rows.
+
+    Raises:
+      IOError: when there is an error querying the attribute container store.
+      OSError: when there is an error querying the attribute container store.
+    """
+    # Use a local cursor to prevent another query interrupting the generator.
+    cursor = self._connection.cursor()
+
+    try:
+      cursor.execute(query)
+    except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+      raise IOError((
+          f'Unable to query attribute container store for container: '
+          f'{container_type:s} with error: {exception!s}'))
+
+    cursor.arraysize = self._MAXIMUM_FETCH_SIZE
+
+    while True:
+      with self._storage_timer('get_containers'):
+        rows = cursor.fetchmany()
+
+      if not rows:
+        break
+
+      yield rows
+
+  def _GetRowsInPages(self, container_type, query):
+    """Retrieves the rows of a query in pages ordered by identifier.
+
+    Every page is retrieved with a separate query that continues after the
+    last identifier of the previous page, hence no cursor is kept open
+    in between pages.
+
+    Args:
+      container_type (str): attribute container type.
+      query (str): SQL query that selects the identifier as its first column
+          and that has a parameter for the last identifier of the previous
+          page and for the maximum number of rows, such as "SELECT
+          _identifier, ... WHERE _identifier > ? ORDER BY _identifier
+          LIMIT ?".
+
+    Yields:
+      list[sqlite3.Row]: page of rows.
+
+    Raises:
+      IOError: when there is an error querying the attribute container store.
+      OSError: when there is an error querying the attribute container store.
+    """
+    last_identifier = 0
+    while True:
+      try:
+        with self._storage_timer('get_containers'):
+          self._cursor.execute(
+              query, (last_identifier, self._MAXIMUM_PAGE_SIZE))
+          rows = self._cursor.fetchall()
+
+      except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+        raise IOError((
+            f'Unable to query attribute container store for container: '
+            f'{container_type:s} with error: {exception!s}'))
+
+      if rows:
+        yield rows
+
+      if len(rows) < self._MAXIMUM_PAGE_SIZE:
+        break
+
+      last_identifier = rows[-1][0]
+
+  def _GetSortedAttributeContainerSchema(self, container_type):
+    """Retrieves the schema of an attribute container sorted by name.
+
+    The sorted schema is cached since the schema does not change at runtime.
+
+    Args:
+      container_type (str): attribute container type.
+
+    Returns:
+      tuple[tuple[str, str]]: name and data type of the attributes, sorted by
+          name.
+
+    Raises:
+      IOError: if an unsupported attribute container is provided.
+      OSError: if an unsupported attribute container is provided.
+    """
+    sorted_schema = self._sorted_schemas.get(container_type, None)
+    if sorted_schema is None:
+      schema = self._GetAttributeContainerSchema(container_type)
+      if not schema:
+        raise IOError(
+            f'Unsupported attribute container type: {container_type:s}')
+
+      sorted_schema = tuple(sorted(schema.items()))
+      self._sorted_schemas[container_type] = sorted_schema
+
+    return sorted_schema
+
   def _HasTable(self, table_name):
     """Determines if a specific table exists.
 
@@ -548,16 +1138,17 @@ class SQLiteAttributeContainerStore(interface.AttributeContainerStore):
       IOError: when there is an error querying the attribute container store.
       OSError: when there is an error querying the attribute container store.
     """
-    query = self._HAS_TABLE_QUERY.format(table_name)
+    if self._table_names is None:
+      try:
+        self._cursor.execute(self._GET_TABLE_NAMES_QUERY)
+      except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+        raise IOError((
+            f'Unable to query attribute container store with error: '
+            f'{exception!s}'))
 
-    try:
-      self._cursor.execute(query)
-    except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
-      raise IOError((
-          f'Unable to query attribute container store with error: '
-          f'{exception!s}'))
+      self._table_names = {row[0] for row in self._cursor}
 
-    return bool(self._cursor.fetchone())
+    return table_name in self._table_names
 
   def _RaiseIfNotReadable(self):
     """Raises if the attribute container store is not readable.
@@ -602,6 +1193,33 @@ class SQLiteAttributeContainerStore(interface.AttributeContainerStore):
     self.format_version = metadata_values['format_version']
     self.serialization_format = metadata_values['serialization_format']
 
+  def _ReadAttributeContainerSequenceNumbers(self):
+    """Reads the sequence numbers of the attribute container tables.
+
+    SQLite stores the largest rowid of every table with an AUTOINCREMENT
+    primary key in the sqlite_sequence table. Since acstore does not delete
+    attribute containers this is the number of attribute containers.
+
+    Returns:
+      dict[str, int]: sequence number of the last attribute container written
+          per table name. Tables without attribute containers are not included.
+
+    Raises:
+      IOError: when there is an error querying the attribute container store.
+      OSError: when there is an error querying the attribute container store.
+    """
+    if not self._HasTable('sqlite_sequence'):
+      return {}
+
+    try:
+      self._cursor.execute(self._GET_SEQUENCE_NUMBERS_QUERY)
+    except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+      raise IOError((
+          f'Unable to query attribute container store with error: '
+          f'{exception!s}'))
+
+    return dict(self._cursor)
+
   def _ReadMetadata(self):
     """Reads metadata.
 
@@ -621,7 +1239,39 @@ class SQLiteAttributeContainerStore(interface.AttributeContainerStore):
           f'Unable to query attribute container store with error: '
           f'{exception!s}'))
 
-    return {row[0]: row[1] for row in self._cursor.fetchall()}
+    return dict(self._cursor)
+
+  def _SerializeAttributeContainer(self, container):
+    """Serializes the attribute values of an attribute container.
+
+    Args:
+      container (AttributeContainer): attribute container.
+
+    Returns:
+      list[object]: serialized attribute values, sorted by attribute name.
+
+    Raises:
+      IOError: if an unsupported attribute container is provided.
+      OSError: if an unsupported attribute container is provided.
+    """
+    serializers = self._GetAttributeContainerSerializers(
+        container.CONTAINER_TYPE)
+    attribute_values_getter = self._GetAttributeValuesGetter(
+        container.CONTAINER_TYPE)
+
+    try:
+      attribute_values = attribute_values_getter(container)
+    except AttributeError:
+      # An attribute that is not set is stored as NULL.
+      attribute_values = [
+          getattr(container, name, None) for name, _ in serializers]
+
+    return [
+        serialize_function(attribute_value)
+        if attribute_value is not None and serialize_function
+        else attribute_value
+        for attribute_value, (_, serialize_function) in zip(
+            attribute_values, serializers)]
 
   def _UpdateStorageMetadataFormatVersion(self):
     """Updates the storage metadata format version.
@@ -631,11 +1281,11 @@ class SQLiteAttributeContainerStore(interface.AttributeContainerStore):
       OSError: when there is an error querying the attribute container store.
     """
     if self.format_version >= self._UPGRADE_COMPATIBLE_FORMAT_VERSION:
-      query = (f'UPDATE metadata SET value = {self._FORMAT_VERSION:d} '
-               f'WHERE key = "format_version"')
+      self._BeginTransaction()
 
       try:
-        self._cursor.execute(query)
+        self._cursor.execute(self._UPDATE_METADATA_VALUE_QUERY, (
+            f'{self._FORMAT_VERSION:d}', 'format_version'))
       except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
         raise IOError((
             f'Unable to query attribute container store with error: '
@@ -655,50 +1305,33 @@ class SQLiteAttributeContainerStore(interface.AttributeContainerStore):
       OSError: when there is an error querying the attribute container store
           or if an unsupported attribute container is provided.
     """
-    self._CommitWriteCache(container.CONTAINER_TYPE)
-
     identifier = container.GetIdentifier()
 
-    schema = self._GetAttributeContainerSchema(container.CONTAINER_TYPE)
-    if not schema:
-      raise IOError(
-          f'Unsupported attribute container type: {container.CONTAINER_TYPE:s}')
+    values = self._SerializeAttributeContainer(container)
+    values.append(identifier.sequence_number)
 
-    column_names = []
-    values = []
-    for name, data_type in sorted(schema.items()):
-      attribute_value = getattr(container, name, None)
-      try:
-        row_value = self._schema_helper.SerializeValue(
-            data_type, attribute_value)
-      except IOError:
-        raise IOError((
-            f'Unsupported attribute container type: '
-            f'{container.CONTAINER_TYPE:s} attribute: {name:s} data type: '
-            f'{data_type:s}'))
+    if container.CONTAINER_TYPE not in self._update_queries:
+      column_names, _ = self._GetAttributeContainerColumns(
+          container.CONTAINER_TYPE)
+      column_names_string = ', '.join([
+          f'{name:s} = ?' for name in column_names])
 
-      column_names.append(f'{name:s} = ?')
-      values.append(row_value)
+      self._update_queries[container.CONTAINER_TYPE] = (
+          f'UPDATE {container.CONTAINER_TYPE:s} SET {column_names_string:s} '
+          f'WHERE _identifier = ?')
 
-    column_names_string = ', '.join(column_names)
+    # Replace a cached, for example prefetched, copy of the container so that
+    # it is not returned after the update.
+    lookup_key = (container.CONTAINER_TYPE, identifier.sequence_number - 1)
+    if lookup_key in self._attribute_container_cache:
+      self._attribute_container_cache[lookup_key] = container
 
-    query = (f'UPDATE {container.CONTAINER_TYPE:s} SET {column_names_string:s} '
-             f'WHERE _identifier = {identifier.sequence_number:d}')
+    update_cache = self._update_cache.setdefault(container.CONTAINER_TYPE, [])
+    update_cache.append(values)
 
-    if self._storage_profiler:
-      self._storage_profiler.StartTiming('write_existing')
-
-    try:
-      self._cursor.execute(query, values)
-
-    except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
-      raise IOError((
-          f'Unable to query attribute container store with error: '
-          f'{exception!s}'))
-
-    finally:
-      if self._storage_profiler:
-        self._storage_profiler.StopTiming('write_existing')
+    if len(update_cache) >= self._GetMaximumWriteCacheSize(
+        container.CONTAINER_TYPE):
+      self._CommitWriteCache(container.CONTAINER_TYPE)
 
   def _WriteMetadata(self):
     """Writes metadata.
@@ -707,6 +1340,8 @@ class SQLiteAttributeContainerStore(interface.AttributeContainerStore):
       IOError: when there is an error querying the attribute container store.
       OSError: when there is an error querying the attribute container store.
     """
+    self._BeginTransaction()
+
     try:
       self._cursor.execute(self._CREATE_METADATA_TABLE_QUERY)
     except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
@@ -714,6 +1349,9 @@ class SQLiteAttributeContainerStore(interface.AttributeContainerStore):
           f'Unable to query attribute container store with error: '
           f'{exception!s}'))
 
+    if self._table_names is not None:
+      self._table_names.add('metadata')
+
     self._WriteMetadataValue('format_version', f'{self._FORMAT_VERSION:d}')
     self._WriteMetadataValue('serialization_format', self.serialization_format)
 
@@ -749,8 +1387,11 @@ class SQLiteAttributeContainerStore(interface.AttributeContainerStore):
       OSError: when there is an error querying the attribute container store
           or if an unsupported attribute container is provided.
     """
-    next_sequence_number = self._GetAttributeContainerNextSequenceNumber(
-        container.CONTAINER_TYPE)
+    # The sequence number is only updated after the container was serialized
+    # and cached for writing, since it is also used as the number of
+    # containers.
+    next_sequence_number = self._attribute_container_sequence_numbers[
+        container.CONTAINER_TYPE] + 1
 
     if (next_sequence_number == 1 and
         not self._HasTable(container.CONTAINER_TYPE)):
@@ -760,29 +1401,13 @@ class SQLiteAttributeContainerStore(interface.AttributeContainerStore):
         name=container.CONTAINER_TYPE, sequence_number=next_sequence_number)
     container.SetIdentifier(identifier)
 
-    schema = self._GetAttributeContainerSchema(container.CONTAINER_TYPE)
-    if not schema:
-      raise IOError(
-          f'Unsupported attribute container type: {container.CONTAINER_TYPE:s}')
-
-    column_names = []
-    row_values = []
-    for name, data_type in sorted(schema.items()):
-      attribute_value = getattr(container, name, None)
-      try:
-        row_value = self._schema_helper.SerializeValue(
-            data_type, attribute_value)
-      except IOError:
-        raise IOError((
-            f'Unsupported attribute container type: '
-            f'{container.CONTAINER_TYPE:s} attribute: {name:s} data type: '
-            f'{data_type:s}'))
-
-      column_names.append(name)
-      row_values.append(row_value)
+    row_values = self._SerializeAttributeContainer(container)
 
     self._CacheAttributeContainerForWrite(
-        container.CONTAINER_TYPE, column_names, row_values)
+        container.CONTAINER_TYPE, row_values)
+
+    self._SetAttributeContainerNextSequenceNumber(
+        container.CONTAINER_TYPE, next_sequence_number)
 
     self._CacheAttributeContainerByIndex(container, next_sequence_number - 1)
 
@@ -802,50 +1427,82 @@ class SQLiteAttributeContainerStore(interface.AttributeContainerStore):
       return False
 
     try:
-      connection = sqlite3.connect(
-          path, detect_types=sqlite3.PARSE_DECLTYPES|sqlite3.PARSE_COLNAMES)
+      with open(path, 'rb') as file_object:
+        signature = file_object.read(len(cls._FILE_SIGNATURE))
 
-      cursor = connection.cursor()
+    except IOError:
+      return False
 
-      query = 'SELECT * FROM metadata'
-      cursor.execute(query)
+    if signature != cls._FILE_SIGNATURE:
+      return False
 
-      metadata_values = {row[0]: row[1] for row in cursor.fetchall()}
+    result = False
+    connection = None
 
-      format_version = metadata_values.get('format_version', None)
-      if format_version:
-        try:
-          format_version = int(format_version, 10)
-          result = True
-        except (TypeError, ValueError):
-          pass
+    try:
+      # Open the database read-only to prevent sqlite3 from creating
+      # a journal file. Note that the database is not opened immutable since
+      # the metadata can still be stored in the WAL file.
+      path_uri = pathlib.Path(os.path.abspath(path)).as_uri()
+      connection = sqlite3.connect(f'{path_uri:s}?mode=ro', uri=True)
+
+      cursor = connection.cursor()
 
-      connection.close()
+      query = (
+          'SELECT value FROM metadata WHERE key = "format_version" LIMIT 1')
+      cursor.execute(query)
+
+      row = cursor.fetchone()
+      if row and row[0]:
+        int(row[0], 10)
+        result = True
 
     except (IOError, TypeError, ValueError, sqlite3.DatabaseError):
       result = False
 
+    finally:
+      if connection:
+        connection.close()
+
     return result
 
   def Close(self):
     """Closes the file.
 
+    The store is closed even if writing cached data fails.
+
     Raises:
-      IOError: if the attribute container store is already closed.
-      OSError: if the attribute container store is already closed.
+      IOError: if the attribute container store is already closed or when
+          there is an error querying the attribute container store.
+      OSError: if the attribute container store is already closed or when
+          there is an error querying the attribute container store.
     """
     if not self._is_open:
       raise IOError('Storage file already closed.')
 
-    if self._connection:
-      self._Flush()
+    try:
+      if self._connection:
+        self._Flush()
+
+        if not self._read_only and self._journal_mode == 'WAL':
+          # Checkpoint and truncate the WAL file and switch back to a rollback
+          # journal, so that the closed store can be opened read-only from
+          # a read-only location. This is best-effort since neither can
+          # complete while other connections read from the store.
+          try:
+            self._connection.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+            self._connection.execute('PRAGMA journal_mode=DELETE')
+          except sqlite3.OperationalError:
+            pass
 
-      self._connection.close()
+    finally:
+      if self._connection:
+        self._connection.close()
 
       self._connection = None
       self._cursor = None
-
-    self._is_open = False
+      self._is_open = False
+      self._table_names = None
 
   def GetAttributeContainerByIdentifier(self, container_type, identifier):
     """Retrieves a specific type of container with a specific identifier.
@@ -883,54 +1540,34 @@ class SQLiteAttributeContainerStore(interface.AttributeContainerStore):
           or if an unsupported attribute container is provided.
     """
     container = self._GetCachedAttributeContainer(container_type, index)
-    if container:
+    if container is not None:
       return container
 
-    self._CommitWriteCache(container_type)
+    # The write cache is always empty when the store is read-only.
+    if not self._read_only:
+      self._CommitWriteCache(container_type)
 
     if not self._attribute_container_sequence_numbers[container_type]:
       return None
 
-    schema = self._GetAttributeContainerSchema(container_type)
-    if not schema:
-      raise IOError(f'Unsupported attribute container type: {container_type:s}')
-
-    column_names = sorted(schema.keys())
-
-    column_names_string = ', '.join(column_names)
-    row_number = index + 1
-
-    query = (f'SELECT {column_names_string:s} FROM {container_type:s} WHERE '
-             f'rowid = {row_number:d}')
-
-    try:
-      self._cursor.execute(query)
-    except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
-      raise IOError((
-          f'Unable to query attribute container store with error: '
-          f'{exception!s}'))
-
-    if self._storage_profiler:
-      self._storage_profiler.StartTiming('get_container_by_index')
+    # If the attribute containers are retrieved by consecutive indexes, those
+    # that follow the index are retrieved as well. Otherwise only the attribute
+    # container of the index is retrieved.
+    last_index = index
+    if self._last_retrieved_index_key == (container_type, index - 1):
+      last_index += self._MAXIMUM_PREFETCH_SIZE - 1
 
-    try:
-      row = self._cursor.fetchone()
+    self._last_retrieved_index_key = (container_type, last_index)
 
-    finally:
-      if self._storage_profiler:
-        self._storage_profiler.StopTiming('get_container_by_index')
-
-    if not row:
+    containers = self._GetAttributeContainersByIndexRange(
+        container_type, index, last_index)
+    if not containers:
       return None
 
-    container = self._CreatetAttributeContainerFromRow(
-        container_type, column_names, row, 0)
-
-    identifier = containers_interface.AttributeContainerIdentifier(
-        name=container_type, sequence_number=row_number)
-    container.SetIdentifier(identifier)
+    container = containers[0]
+    if container.GetIdentifier().sequence_number != index + 1:
+      return None
 
-    self._CacheAttributeContainerByIndex(container, index)
     return container
 
   def GetAttributeContainers(self, container_type, filter_expression=None):
@@ -950,16 +1587,11 @@ class SQLiteAttributeContainerStore(interface.AttributeContainerStore):
       OSError: when there is an error querying the attribute container store
           or if an unsupported attribute container is provided.
     """
-    schema = self._GetAttributeContainerSchema(container_type)
-    if not schema:
-      raise IOError(f'Unsupported attribute container type: {container_type:s}')
-
-    column_names = sorted(schema.keys())
+    column_names, _ = self._GetAttributeContainerColumns(container_type)
 
     sql_filter_expression = None
     if filter_expression:
-      expression_ast = ast.parse(filter_expression, mode='eval')
-      sql_filter_expression = PythonAST2SQL(expression_ast.body)
+      sql_filter_expression = PythonExpression2SQL(filter_expression)
 
     return self._GetAttributeContainersWithFilter(
         container_type, column_names=column_names,
@@ -978,11 +1610,18 @@ class SQLiteAttributeContainerStore(interface.AttributeContainerStore):
       IOError: when there is an error querying the attribute container store.
       OSError: when there is an error querying the attribute container store.
     """
-    self._CommitWriteCache(container_type)
+    # The write cache is always empty when the store is read-only.
+    if not self._read_only:
+      self._CommitWriteCache(container_type)
 
     if not self._HasTable(container_type):
       return 0
 
+    # The sequence number of the last attribute container written is
+    # the number of attribute containers.
+    if container_type in self._attribute_container_sequence_numbers:
+      return self._attribute_container_sequence_numbers[container_type]
+
     # Note that this is SQLite specific, and will give inaccurate results if
     # there are DELETE commands run on the table. acstore does not run any
     # DELETE commands.
@@ -996,10 +1635,12 @@ class SQLiteAttributeContainerStore(interface.AttributeContainerStore):
           f'{exception!s}'))
 
     row = self._cursor.fetchone()
-    if not row:
-      return 0
+    number_of_containers = (row[0] if row else None) or 0
+
+    self._SetAttributeContainerNextSequenceNumber(
+        container_type, number_of_containers)
 
-    return row[0] or 0
+    return number_of_containers
 
   def HasAttributeContainers(self, container_type):
     """Determines if store contains a specific type of attribute containers.
@@ -1018,20 +1659,27 @@ class SQLiteAttributeContainerStore(interface.AttributeContainerStore):
     count = self.GetNumberOfAttributeContainers(container_type)
     return count > 0
 
-  def Open(self, path=None, read_only=True, **unused_kwargs):  # pylint: disable=arguments-differ
+  def Open(  # pylint: disable=arguments-differ
+      self, path=None, read_only=True, journal_mode='WAL',
+      synchronous='NORMAL', **unused_kwargs):
     """Opens the store.
 
     Args:
       path (Optional[str]): path to the attribute container store.
       read_only (Optional[bool]): True if the file should be opened in
           read-only mode.
+      journal_mode (Optional[str]): SQLite journal mode, such as "WAL" or
+          "MEMORY", used when the store is opened for writing.
+      synchronous (Optional[str]): SQLite synchronous mode, such as "NORMAL"
+          or "OFF", used when the store is opened for writing.
 
     Raises:
       IOError: if the attribute container store is already opened or if
           the database cannot be connected.
       OSError: if the attribute container store is already opened or if
           the database cannot be connected.
-      ValueError: if path is missing.
+      ValueError: if path is missing or if the journal or synchronous mode
+          is not supported.
     """
     if self._is_open:
       raise IOError('Storage file already opened.')
@@ -1039,38 +1687,62 @@ class SQLiteAttributeContainerStore(interface.AttributeContainerStore):
     if not path:
       raise ValueError('Missing path.')
 
-    path = os.path.abspath(path)
+    journal_mode = journal_mode.upper()
+    if journal_mode not in self._JOURNAL_MODES:
+      raise ValueError(f'Unsupported journal mode: {journal_mode:s}')
 
-    try:
-      path_uri = pathlib.Path(path).as_uri()
-      if read_only:
-        path_uri = f'{path_uri:s}?mode=ro'
+    synchronous = synchronous.upper()
+    if synchronous not in self._SYNCHRONOUS_MODES:
+      raise ValueError(f'Unsupported synchronous mode: {synchronous:s}')
 
-    except ValueError:
-      path_uri = None
+    path = os.path.abspath(path)
 
     detect_types = sqlite3.PARSE_DECLTYPES|sqlite3.PARSE_COLNAMES
 
-    if path_uri:
+    # Transactions are managed explicitly, see _BeginTransaction().
+    if read_only:
+      # A URI is only needed to open the database in read-only mode. Note
+      # that the path is absolute, which is required by as_uri().
+      path_uri = pathlib.Path(path).as_uri()
       connection = sqlite3.connect(
-          path_uri, detect_types=detect_types, isolation_level='DEFERRED',
-          uri=True)
+          f'{path_uri:s}?mode=ro',
+          cached_statements=self._MAXIMUM_CACHED_STATEMENTS,
+          detect_types=detect_types, isolation_level=None, uri=True)
     else:
       connection = sqlite3.connect(
-          path, detect_types=detect_types, isolation_level='DEFERRED')
+          path, cached_statements=self._MAXIMUM_CACHED_STATEMENTS,
+          detect_types=detect_types, isolation_level=None)
 
     try:
-      # Use in-memory journaling mode to reduce IO.
-      connection.execute('PRAGMA journal_mode=MEMORY')
+      if read_only:
+        # Prevent SQLite from acquiring write locks.
+        connection.execute('PRAGMA query_only=ON')
 
-      # Turn off insert transaction integrity since we want to do bulk insert.
-      connection.execute('PRAGMA synchronous=OFF')
+      else:
+        # In WAL mode changes are appended to a separate log file, which only
+        # needs to be synchronized at checkpoints when synchronous is NORMAL.
+        connection.execute(f'PRAGMA journal_mode={journal_mode:s}')
+        connection.execute(f'PRAGMA synchronous={synchronous:s}')
+
+        if journal_mode == 'WAL':
+          connection.execute(
+              f'PRAGMA wal_autocheckpoint={self._WAL_AUTOCHECKPOINT:d}')
+
+      # Keep temporary tables and indices in memory, use a larger page cache
+      # and memory-mapped I/O. Note that SQLite only maps the part of
+      # the maximum size that exists in the database file.
+      connection.execute('PRAGMA temp_store=MEMORY')
+      connection.execute(f'PRAGMA cache_size={self._cache_size:d}')
+      connection.execute(f'PRAGMA mmap_size={self._mmap_size:d}')
 
     except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
       raise IOError((
           f'Unable to query attribute container store with error: '
           f'{exception!s}'))
 
+    # Rows are accessed by index, hence they are returned as plain tuples.
+    connection.row_factory = None
+
     cursor = connection.cursor()
     if not cursor:
       return
@@ -1078,6 +1750,7 @@ class SQLiteAttributeContainerStore(interface.AttributeContainerStore):
     self._connection = connection
     self._cursor = cursor
     self._is_open = True
+    self._journal_mode = journal_mode
     self._read_only = read_only
 
     if read_only:
@@ -1096,7 +1769,20 @@ class SQLiteAttributeContainerStore(interface.AttributeContainerStore):
 
     # Initialize next_sequence_number based on the file contents so that
     # AttributeContainerIdentifier points to the correct attribute container.
+    self._attribute_container_sequence_numbers.clear()
+
+    sequence_numbers = self._ReadAttributeContainerSequenceNumbers()
     for container_type in self._containers_manager.GetContainerTypes():
-      next_sequence_number = self.GetNumberOfAttributeContainers(container_type)
+      next_sequence_number = sequence_numbers.get(container_type, None)
+
+      # Only query the tables that exist but have no sequence number, which
+      # normally are empty.
+      if next_sequence_number is None:
+        if self._HasTable(container_type):
+          next_sequence_number = self.GetNumberOfAttributeContainers(
+              container_type)
+        else:
+          next_sequence_number = 0
+
       self._SetAttributeContainerNextSequenceNumber(
           container_type, next_sequence_number)
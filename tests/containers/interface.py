@@ -12,6 +12,17 @@ from tests import test_lib
 class AttributeContainerIdentifierTest(test_lib.BaseTestCase):
   """Tests for the attribute container identifier."""
 
+  def testCopyFromString(self):
+    """Tests the CopyFromString function."""
+    identifier = interface.AttributeContainerIdentifier()
+    identifier.CopyFromString('test_container.5')
+
+    self.assertEqual(identifier.name, 'test_container')
+    self.assertEqual(identifier.sequence_number, 5)
+
+    with self.assertRaises(ValueError):
+      identifier.CopyFromString('test_container')
+
   def testCopyToString(self):
     """Tests the CopyToString function."""
     sequence_number = id(self)
@@ -23,12 +34,49 @@ class AttributeContainerIdentifierTest(test_lib.BaseTestCase):
     self.assertEqual(
         identifier_string, f'test_container.{sequence_number:d}')
 
+    identifier.sequence_number = 1
+
+    identifier_string = identifier.CopyToString()
+    self.assertEqual(identifier_string, 'test_container.1')
+
+    identifier = interface.AttributeContainerIdentifier()
+
+    identifier_string = identifier.CopyToString()
+    self.assertIsNone(identifier_string)
+
 
 class AttributeContainerTest(test_lib.BaseTestCase):
   """Tests for the attribute container interface."""
 
   # pylint: disable=protected-access
 
+  def testInitSubclass(self):
+    """Tests the __init_subclass__ function."""
+
+    class _TestAttributeContainer(interface.AttributeContainer):
+      """Attribute container for testing purposes."""
+
+      _SERIALIZABLE_PROTECTED_ATTRIBUTES = ['_protected_attribute']
+
+    self.assertEqual(
+        _TestAttributeContainer._SERIALIZABLE_PROTECTED_ATTRIBUTES,
+        frozenset(['_protected_attribute']))
+
+  def testCopyFromDict(self):
+    """Tests the CopyFromDict function."""
+    attribute_container = interface.AttributeContainer()
+    attribute_container._SERIALIZABLE_PROTECTED_ATTRIBUTES = [
+        '_protected_attribute']
+
+    attribute_container.CopyFromDict({
+        '_private_attribute': 'private',
+        '_protected_attribute': 'protected',
+        'attribute_name': 'attribute_name'})
+
+    self.assertFalse(hasattr(attribute_container, '_private_attribute'))
+    self.assertEqual(attribute_container._protected_attribute, 'protected')
+    self.assertEqual(attribute_container.attribute_name, 'attribute_name')
+
   def testCopyToDict(self):
     """Tests the CopyToDict function."""
     attribute_container = interface.AttributeContainer()
@@ -43,6 +91,16 @@ class AttributeContainerTest(test_lib.BaseTestCase):
 
     self.assertEqual(test_dict, expected_dict)
 
+    attribute_container._protected_attribute = 'protected'
+    attribute_container._SERIALIZABLE_PROTECTED_ATTRIBUTES = [
+        '_protected_attribute']
+
+    expected_dict['_protected_attribute'] = 'protected'
+
+    test_dict = attribute_container.CopyToDict()
+
+    self.assertEqual(test_dict, expected_dict)
+
   def testGetAttributeNames(self):
     """Tests the GetAttributeNames function."""
     attribute_container = interface.AttributeContainer()
@@ -66,6 +124,14 @@ class AttributeContainerTest(test_lib.BaseTestCase):
 
     self.assertEqual(attribute_names, expected_attribute_names)
 
+    del attribute_container._protected_attribute
+
+    expected_attribute_names = ['attribute_name', 'attribute_value']
+
+    attribute_names = sorted(attribute_container.GetAttributeNames())
+
+    self.assertEqual(attribute_names, expected_attribute_names)
+
   def testGetAttributes(self):
     """Tests the GetAttributes function."""
     attribute_container = interface.AttributeContainer()
@@ -103,6 +169,7 @@ class AttributeContainerTest(test_lib.BaseTestCase):
     attribute_values_hash1 = attribute_container.GetAttributeValuesHash()
 
     attribute_container.attribute_value = 'changes'
+    attribute_container.InvalidateComparable()
 
     attribute_values_hash2 = attribute_container.GetAttributeValuesHash()
 
@@ -112,6 +179,7 @@ class AttributeContainerTest(test_lib.BaseTestCase):
 
     attribute_container._SERIALIZABLE_PROTECTED_ATTRIBUTES = [
         '_protected_attribute']
+    attribute_container.InvalidateComparable()
 
     attribute_values_hash2 = attribute_container.GetAttributeValuesHash()
 
@@ -127,6 +195,7 @@ class AttributeContainerTest(test_lib.BaseTestCase):
     attribute_values_string1 = attribute_container.GetAttributeValuesString()
 
     attribute_container.attribute_value = 'changes'
+    attribute_container.InvalidateComparable()
 
     attribute_values_string2 = attribute_container.GetAttributeValuesString()
 
@@ -136,11 +205,20 @@ class AttributeContainerTest(test_lib.BaseTestCase):
 
     attribute_container._SERIALIZABLE_PROTECTED_ATTRIBUTES = [
         '_protected_attribute']
+    attribute_container.InvalidateComparable()
 
     attribute_values_string2 = attribute_container.GetAttributeValuesString()
 
     self.assertNotEqual(attribute_values_string1, attribute_values_string2)
 
+    attribute_container = interface.AttributeContainer()
+    attribute_container.attribute_dict = {'key': 'value'}
+    attribute_container.attribute_bytes = b'value'
+
+    attribute_values_string = attribute_container.GetAttributeValuesString()
+    self.assertEqual(attribute_values_string, (
+        'attribute_bytes: b\'value\', attribute_dict: [(\'key\', \'value\')]'))
+
   def testGetIdentifier(self):
     """Tests the GetIdentifier function."""
     attribute_container = interface.AttributeContainer()
@@ -149,11 +227,31 @@ class AttributeContainerTest(test_lib.BaseTestCase):
 
     self.assertIsNotNone(identifier)
 
+  def testInvalidateComparable(self):
+    """Tests the InvalidateComparable function."""
+    attribute_container = interface.AttributeContainer()
+    attribute_container.attribute_value = 'attribute_value'
+
+    attribute_values_string1 = attribute_container.GetAttributeValuesString()
+
+    attribute_container.attribute_value = 'changes'
+
+    attribute_values_string2 = attribute_container.GetAttributeValuesString()
+    self.assertEqual(attribute_values_string1, attribute_values_string2)
+
+    attribute_container.InvalidateComparable()
+
+    attribute_values_string2 = attribute_container.GetAttributeValuesString()
+    self.assertNotEqual(attribute_values_string1, attribute_values_string2)
+
   def testMatchesExpression(self):
     """Tests the MatchesExpression function."""
     attribute_container = interface.AttributeContainer()
     attribute_container.name = 'value'
 
+    result = attribute_container.MatchesExpression(None)
+    self.assertTrue(result)
+
     result = attribute_container.MatchesExpression('name == "value"')
     self.assertTrue(result)
 
@@ -163,6 +261,42 @@ class AttributeContainerTest(test_lib.BaseTestCase):
     result = attribute_container.MatchesExpression('bogus')
     self.assertFalse(result)
 
+    result = attribute_container.MatchesExpression('name ==')
+    self.assertFalse(result)
+
+    result = attribute_container.MatchesExpression('name.startswith("v")')
+    self.assertTrue(result)
+
+    result = attribute_container.MatchesExpression('len(name) == 5')
+    self.assertFalse(result)
+
+    result = attribute_container.MatchesExpression(
+        '__builtins__.update(leaked="yes")')
+    self.assertFalse(result)
+
+    result = attribute_container.MatchesExpression('leaked.startswith("y")')
+    self.assertFalse(result)
+
+    attribute_container._protected_attribute = 'protected'
+
+    result = attribute_container.MatchesExpression(
+        '_protected_attribute == "protected"')
+    self.assertFalse(result)
+
+    attribute_container._SERIALIZABLE_PROTECTED_ATTRIBUTES = [
+        '_protected_attribute']
+
+    result = attribute_container.MatchesExpression(
+        '_protected_attribute == "protected"')
+    self.assertTrue(result)
+
+    attribute_container.identifier = interface.AttributeContainerIdentifier(
+        name='test_container', sequence_number=1)
+
+    result = attribute_container.MatchesExpression(
+        'identifier == "test_container.1"')
+    self.assertTrue(result)
+
   def testSetIdentifier(self):
     """Tests the SetIdentifier function."""
     attribute_container = interface.AttributeContainer()
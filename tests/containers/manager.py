@@ -4,6 +4,7 @@
 
 import unittest
 
+from acstore.containers import interface
 from acstore.containers import manager
 
 from tests import test_lib as shared_test_lib
@@ -62,6 +63,40 @@ class AttributeContainersManagerTest(shared_test_lib.BaseTestCase):
       manager.AttributeContainersManager.DeregisterAttributeContainer(
           shared_test_lib.TestAttributeContainer)
 
+  def testRegisterAttributeContainers(self):
+    """Tests the RegisterAttributeContainers function."""
+
+    class _TestAttributeContainer(interface.AttributeContainer):
+      """Attribute container for testing purposes."""
+
+      CONTAINER_TYPE = 'test_container2'
+
+    number_of_classes = len(
+        manager.AttributeContainersManager._attribute_container_classes)
+
+    manager.AttributeContainersManager.RegisterAttributeContainers([
+        shared_test_lib.TestAttributeContainer, _TestAttributeContainer])
+
+    try:
+      self.assertEqual(
+          len(manager.AttributeContainersManager._attribute_container_classes),
+          number_of_classes + 2)
+
+    finally:
+      manager.AttributeContainersManager.DeregisterAttributeContainer(
+          shared_test_lib.TestAttributeContainer)
+      manager.AttributeContainersManager.DeregisterAttributeContainer(
+          _TestAttributeContainer)
+
+    with self.assertRaises(KeyError):
+      manager.AttributeContainersManager.RegisterAttributeContainers([
+          shared_test_lib.TestAttributeContainer,
+          shared_test_lib.TestAttributeContainer])
+
+    self.assertEqual(
+        len(manager.AttributeContainersManager._attribute_container_classes),
+        number_of_classes)
+
   def testAttributeContainerRegistration(self):
     """Tests the Register and DeregisterAttributeContainer functions."""
     number_of_classes = len(
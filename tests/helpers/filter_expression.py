@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the filter expression helper."""
+
+import unittest
+
+from acstore.helpers import filter_expression
+
+from tests import test_lib as shared_test_lib
+
+
+class FilterExpressionTest(shared_test_lib.BaseTestCase):
+  """Tests for the filter expression helper."""
+
+  def testCompileFilterExpression(self):
+    """Tests the CompileFilterExpression function."""
+    namespace = {'name': 'value', 'number': 5}
+
+    predicate = filter_expression.CompileFilterExpression('name == "value"')
+    self.assertTrue(predicate(namespace))
+
+    predicate = filter_expression.CompileFilterExpression('name != "value"')
+    self.assertFalse(predicate(namespace))
+
+    predicate = filter_expression.CompileFilterExpression(
+        'name == "value" and number >= 5')
+    self.assertTrue(predicate(namespace))
+
+    predicate = filter_expression.CompileFilterExpression(
+        'name == "bogus" or not number < 5')
+    self.assertTrue(predicate(namespace))
+
+    predicate = filter_expression.CompileFilterExpression('1 < number <= 4')
+    self.assertFalse(predicate(namespace))
+
+    predicate = filter_expression.CompileFilterExpression(
+        'number in (-1, 5)')
+    self.assertTrue(predicate(namespace))
+
+    predicate = filter_expression.CompileFilterExpression(
+        'name not in ["value"]')
+    self.assertFalse(predicate(namespace))
+
+    predicate = filter_expression.CompileFilterExpression(
+        'name is not None and number != 5.0')
+    self.assertFalse(predicate(namespace))
+
+    predicate = filter_expression.CompileFilterExpression('bogus == 1')
+    with self.assertRaises(KeyError):
+      predicate(namespace)
+
+    with self.assertRaises(TypeError):
+      filter_expression.CompileFilterExpression('name.startswith("v")')
+
+    with self.assertRaises(SyntaxError):
+      filter_expression.CompileFilterExpression('name ==')
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -5,6 +5,7 @@
 import unittest
 
 from acstore import interface
+from acstore import profilers
 from acstore.containers import manager
 
 from tests import test_lib
@@ -56,7 +57,17 @@ class AttributeContainerStoreTest(test_lib.BaseTestCase):
   def testSetStorageProfiler(self):
     """Tests the SetStorageProfiler function."""
     test_store = interface.AttributeContainerStore()
+
+    with test_lib.TempDirectory() as temp_directory:
+      test_profiler = profilers.StorageProfiler('test', temp_directory)
+      test_store.SetStorageProfiler(test_profiler)
+      self.assertEqual(test_store._storage_timer, test_profiler.TimeSection)
+
     test_store.SetStorageProfiler(None)
+    self.assertEqual(test_store._storage_timer, interface._NullTimeSection)
+
+    with test_store._storage_timer('test_profile'):
+      pass
 
 
 if __name__ == '__main__':
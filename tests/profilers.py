@@ -58,6 +58,22 @@ class StorageProfilerTest(test_lib.BaseTestCase):
 
       test_profiler.Stop()
 
+  def testTimeSection(self):
+    """Tests the TimeSection function."""
+    with test_lib.TempDirectory() as temp_directory:
+      test_profiler = profilers.StorageProfiler(
+          'test', temp_directory)
+
+      test_profiler.Start()
+
+      with test_profiler.TimeSection('test_profile'):
+        time.sleep(0.01)
+
+      measurements = test_profiler._profile_measurements['test_profile']
+      self.assertGreater(measurements.total_cpu_time, 0.0)
+
+      test_profiler.Stop()
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 """Tests for the SQLite-based attribute container store."""
 
+import ast
 import os
 import unittest
 
@@ -11,6 +12,14 @@ from acstore.containers import manager as containers_manager
 from tests import test_lib
 
 
+class _TestUnsupportedAttributeContainer(test_lib.TestAttributeContainer):
+  """Attribute container with an unsupported data type for testing."""
+
+  CONTAINER_TYPE = 'unsupported_container'
+
+  SCHEMA = {'attribute': 'bogus'}
+
+
 class _TestSQLiteAttributeContainerStoreV20220716(
     sqlite_store.SQLiteAttributeContainerStore):
   """Test class for testing format compatibility checks."""
@@ -31,7 +40,29 @@ class _TestSQLiteAttributeContainerStoreV20221023(
   _READ_COMPATIBLE_FORMAT_VERSION = 20211121
 
 
-# TODO add tests for PythonAST2SQL.
+class PythonAST2SQLTest(test_lib.BaseTestCase):
+  """Tests for the Python AST to SQL conversion functions."""
+
+  def testPythonAST2SQL(self):
+    """Tests the PythonAST2SQL function."""
+    expression_ast = ast.parse(
+        'attribute == "value" and number != 1', mode='eval')
+    sql = sqlite_store.PythonAST2SQL(expression_ast.body)
+    self.assertEqual(sql, 'attribute = "value" AND number <> 1')
+
+    expression_ast = ast.parse('attribute < 1', mode='eval')
+    with self.assertRaises(TypeError):
+      sqlite_store.PythonAST2SQL(expression_ast.body)
+
+    expression_ast = ast.parse('attribute()', mode='eval')
+    with self.assertRaises(TypeError):
+      sqlite_store.PythonAST2SQL(expression_ast.body)
+
+  def testPythonExpression2SQL(self):
+    """Tests the PythonExpression2SQL function."""
+    sql = sqlite_store.PythonExpression2SQL(
+        'attribute == "value" or number == 1')
+    self.assertEqual(sql, 'attribute = "value" OR number = 1')
 
 
 class SQLiteSchemaHelperTest(test_lib.BaseTestCase):
@@ -79,6 +110,32 @@ class SQLiteSchemaHelperTest(test_lib.BaseTestCase):
 
     # TODO: add test for AttributeContainerIdentifier
 
+  def testGetDeserializeValueFunction(self):
+    """Tests the GetDeserializeValueFunction function."""
+    schema_helper = sqlite_store.SQLiteSchemaHelper()
+
+    deserialize_function = schema_helper.GetDeserializeValueFunction('bool')
+    self.assertTrue(deserialize_function(1))
+
+    deserialize_function = schema_helper.GetDeserializeValueFunction('str')
+    self.assertIsNone(deserialize_function)
+
+    with self.assertRaises(IOError):
+      schema_helper.GetDeserializeValueFunction('bogus')
+
+  def testGetSerializeValueFunction(self):
+    """Tests the GetSerializeValueFunction function."""
+    schema_helper = sqlite_store.SQLiteSchemaHelper()
+
+    serialize_function = schema_helper.GetSerializeValueFunction('bool')
+    self.assertEqual(serialize_function(True), 1)
+
+    serialize_function = schema_helper.GetSerializeValueFunction('str')
+    self.assertIsNone(serialize_function)
+
+    with self.assertRaises(IOError):
+      schema_helper.GetSerializeValueFunction('bogus')
+
   def testSerializeValue(self):
     """Tests the SerializeValue function."""
     schema_helper = sqlite_store.SQLiteSchemaHelper()
@@ -108,13 +165,37 @@ class SQLiteAttributeContainerStoreTest(test_lib.BaseTestCase):
 
   def setUp(self):
     """Sets up the needed objects used throughout the test."""
-    containers_manager.AttributeContainersManager.RegisterAttributeContainer(
-        test_lib.TestAttributeContainer)
+    containers_manager.AttributeContainersManager.RegisterAttributeContainers([
+        test_lib.TestAttributeContainer, _TestUnsupportedAttributeContainer])
 
   def tearDown(self):
     """Cleans up the needed objects used throughout the test."""
     containers_manager.AttributeContainersManager.DeregisterAttributeContainer(
         test_lib.TestAttributeContainer)
+    containers_manager.AttributeContainersManager.DeregisterAttributeContainer(
+        _TestUnsupportedAttributeContainer)
+
+  def testBeginTransaction(self):
+    """Tests the _BeginTransaction function."""
+    with test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'acstore.sqlite')
+      test_store = sqlite_store.SQLiteAttributeContainerStore()
+      test_store.Open(path=test_path, read_only=False)
+
+      try:
+        self.assertFalse(test_store._connection.in_transaction)
+
+        test_store._BeginTransaction()
+        self.assertTrue(test_store._connection.in_transaction)
+
+        test_store._BeginTransaction()
+        self.assertTrue(test_store._connection.in_transaction)
+
+        test_store._Flush()
+        self.assertFalse(test_store._connection.in_transaction)
+
+      finally:
+        test_store.Close()
 
   def testCacheAttributeContainerByIndex(self):
     """Tests the _CacheAttributeContainerByIndex function."""
@@ -128,6 +209,33 @@ class SQLiteAttributeContainerStoreTest(test_lib.BaseTestCase):
       test_store._CacheAttributeContainerByIndex(attribute_container, 0)
       self.assertEqual(len(test_store._attribute_container_cache), 1)
 
+  def testCacheAttributeContainerByIndexEviction(self):
+    """Tests the _CacheAttributeContainerByIndex function eviction."""
+    attribute_container = test_lib.TestAttributeContainer()
+
+    test_store = sqlite_store.SQLiteAttributeContainerStore()
+    test_store._MAXIMUM_CACHED_CONTAINERS = 2
+
+    test_store._CacheAttributeContainerByIndex(attribute_container, 0)
+    test_store._CacheAttributeContainerByIndex(attribute_container, 1)
+
+    # Make index 0 the most recently used attribute container.
+    cached_container = test_store._GetCachedAttributeContainer(
+        attribute_container.CONTAINER_TYPE, 0)
+    self.assertIsNotNone(cached_container)
+
+    test_store._CacheAttributeContainerByIndex(attribute_container, 2)
+    self.assertEqual(list(test_store._attribute_container_cache.keys()), [
+        ('test_container', 0), ('test_container', 2)])
+
+    cached_container = test_store._GetCachedAttributeContainer(
+        attribute_container.CONTAINER_TYPE, 0)
+    self.assertIsNotNone(cached_container)
+
+    cached_container = test_store._GetCachedAttributeContainer(
+        attribute_container.CONTAINER_TYPE, 1)
+    self.assertIsNone(cached_container)
+
   def testCheckStorageMetadata(self):
     """Tests the _CheckStorageMetadata function."""
     with test_lib.TempDirectory():
@@ -138,6 +246,11 @@ class SQLiteAttributeContainerStoreTest(test_lib.BaseTestCase):
           'serialization_format': 'json'}
       test_store._CheckStorageMetadata(metadata_values)
 
+      # Test with metadata values that were already checked.
+      self.assertEqual(
+          metadata_values['format_version'], test_store._FORMAT_VERSION)
+      test_store._CheckStorageMetadata(metadata_values)
+
       metadata_values['format_version'] = 'bogus'
       with self.assertRaises(IOError):
         test_store._CheckStorageMetadata(metadata_values)
@@ -146,6 +259,10 @@ class SQLiteAttributeContainerStoreTest(test_lib.BaseTestCase):
       with self.assertRaises(IOError):
         test_store._CheckStorageMetadata(metadata_values)
 
+      metadata_values['format_version'] = f'{test_store._FORMAT_VERSION + 1:d}'
+      with self.assertRaises(IOError):
+        test_store._CheckStorageMetadata(metadata_values)
+
       metadata_values['format_version'] = f'{test_store._FORMAT_VERSION:d}'
       metadata_values['serialization_format'] = 'bogus'
       with self.assertRaises(IOError):
@@ -174,8 +291,96 @@ class SQLiteAttributeContainerStoreTest(test_lib.BaseTestCase):
         test_store.Close()
 
   # TODO: add tests for _CreatetAttributeContainerFromRow
-  # TODO: add tests for _Flush
-  # TODO: add tests for _FlushWriteCache
+
+  def testFlush(self):
+    """Tests the _Flush function."""
+    attribute_container = test_lib.TestAttributeContainer()
+
+    with test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'acstore.sqlite')
+      test_store = sqlite_store.SQLiteAttributeContainerStore()
+      test_store.Open(path=test_path, read_only=False)
+
+      try:
+        test_store.AddAttributeContainer(attribute_container)
+        self.assertTrue(test_store._write_cache)
+
+        test_store._Flush()
+        self.assertFalse(test_store._write_cache)
+        self.assertFalse(test_store._connection.in_transaction)
+
+        test_store._Flush()
+
+        number_of_containers = test_store.GetNumberOfAttributeContainers(
+            attribute_container.CONTAINER_TYPE)
+        self.assertEqual(number_of_containers, 1)
+
+      finally:
+        test_store.Close()
+
+  def testFlushWriteCache(self):
+    """Tests the _FlushWriteCache function."""
+    with test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'acstore.sqlite')
+      test_store = sqlite_store.SQLiteAttributeContainerStore()
+      test_store.Open(path=test_path, read_only=False)
+
+      try:
+        test_store._CreateAttributeContainerTable('test_container')
+
+        write_cache = [('first',), ('second',)]
+        test_store._FlushWriteCache('test_container', write_cache)
+
+        test_store._cursor.execute(
+            'SELECT attribute FROM test_container ORDER BY _identifier')
+        rows = test_store._cursor.fetchall()
+        self.assertEqual(rows, [('first',), ('second',)])
+
+      finally:
+        test_store.Close()
+
+  def testGetAttributeContainerColumns(self):
+    """Tests the _GetAttributeContainerColumns function."""
+    test_store = sqlite_store.SQLiteAttributeContainerStore()
+
+    column_names, column_names_string = (
+        test_store._GetAttributeContainerColumns('test_container'))
+    self.assertEqual(column_names, ('attribute',))
+    self.assertEqual(column_names_string, 'attribute')
+
+    with self.assertRaises(IOError):
+      test_store._GetAttributeContainerColumns('bogus')
+
+  def testGetAttributeContainersByIndexRange(self):
+    """Tests the _GetAttributeContainersByIndexRange function."""
+    with test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'acstore.sqlite')
+      test_store = sqlite_store.SQLiteAttributeContainerStore()
+      test_store.Open(path=test_path, read_only=False)
+
+      try:
+        for index in range(4):
+          attribute_container = test_lib.TestAttributeContainer()
+          attribute_container.attribute = f'{index:d}'
+          test_store.AddAttributeContainer(attribute_container)
+
+        test_store._CommitWriteCache('test_container')
+        test_store._attribute_container_cache.clear()
+
+        containers = test_store._GetAttributeContainersByIndexRange(
+            'test_container', 1, 2)
+        self.assertEqual(
+            [container.attribute for container in containers], ['1', '2'])
+        self.assertEqual(len(test_store._attribute_container_cache), 2)
+
+        # Attribute containers that are already cached are not retrieved.
+        containers = test_store._GetAttributeContainersByIndexRange(
+            'test_container', 0, 9)
+        self.assertEqual(
+            [container.attribute for container in containers], ['0', '3'])
+
+      finally:
+        test_store.Close()
 
   def testGetAttributeContainersWithFilter(self):
     """Tests the _GetAttributeContainersWithFilter function."""
@@ -236,6 +441,82 @@ class SQLiteAttributeContainerStoreTest(test_lib.BaseTestCase):
           attribute_container.CONTAINER_TYPE, 1)
       self.assertIsNotNone(cached_container)
 
+  def testGetMaximumWriteCacheSize(self):
+    """Tests the _GetMaximumWriteCacheSize function."""
+    test_store = sqlite_store.SQLiteAttributeContainerStore()
+
+    maximum_write_cache_size = test_store._GetMaximumWriteCacheSize(
+        'test_container')
+    self.assertEqual(maximum_write_cache_size, 1000)
+
+    with self.assertRaises(IOError):
+      test_store._GetMaximumWriteCacheSize('bogus')
+
+  def testGetRowsInBatches(self):
+    """Tests the _GetRowsInBatches function."""
+    with test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'acstore.sqlite')
+      test_store = sqlite_store.SQLiteAttributeContainerStore()
+      test_store._MAXIMUM_FETCH_SIZE = 2
+      test_store.Open(path=test_path, read_only=False)
+
+      try:
+        for index in range(5):
+          attribute_container = test_lib.TestAttributeContainer()
+          attribute_container.attribute = f'{index:d}'
+          test_store.AddAttributeContainer(attribute_container)
+
+        test_store._CommitWriteCache('test_container')
+
+        query = 'SELECT _identifier, attribute FROM test_container'
+        batches = list(test_store._GetRowsInBatches('test_container', query))
+        self.assertEqual([len(rows) for rows in batches], [2, 2, 1])
+
+        with self.assertRaises(IOError):
+          list(test_store._GetRowsInBatches('bogus', 'SELECT * FROM bogus'))
+
+      finally:
+        test_store.Close()
+
+  def testGetRowsInPages(self):
+    """Tests the _GetRowsInPages function."""
+    with test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'acstore.sqlite')
+      test_store = sqlite_store.SQLiteAttributeContainerStore()
+      test_store._MAXIMUM_PAGE_SIZE = 2
+      test_store.Open(path=test_path, read_only=False)
+
+      try:
+        for index in range(4):
+          attribute_container = test_lib.TestAttributeContainer()
+          attribute_container.attribute = f'{index:d}'
+          test_store.AddAttributeContainer(attribute_container)
+
+        test_store._CommitWriteCache('test_container')
+
+        query = (
+            'SELECT _identifier, attribute FROM test_container '
+            'WHERE _identifier > ? ORDER BY _identifier LIMIT ?')
+        pages = list(test_store._GetRowsInPages('test_container', query))
+        self.assertEqual(len(pages), 2)
+
+        attribute_values = [row[1] for rows in pages for row in rows]
+        self.assertEqual(attribute_values, ['0', '1', '2', '3'])
+
+      finally:
+        test_store.Close()
+
+  def testGetSortedAttributeContainerSchema(self):
+    """Tests the _GetSortedAttributeContainerSchema function."""
+    test_store = sqlite_store.SQLiteAttributeContainerStore()
+
+    sorted_schema = test_store._GetSortedAttributeContainerSchema(
+        'test_container')
+    self.assertEqual(sorted_schema, (('attribute', 'str'),))
+
+    with self.assertRaises(IOError):
+      test_store._GetSortedAttributeContainerSchema('bogus')
+
   def testHasTable(self):
     """Tests the _HasTable function."""
     with test_lib.TempDirectory() as temp_directory:
@@ -252,6 +533,11 @@ class SQLiteAttributeContainerStoreTest(test_lib.BaseTestCase):
         result = test_store._HasTable('bogus')
         self.assertFalse(result)
 
+        test_store._table_names = None
+
+        result = test_store._HasTable('test_container')
+        self.assertTrue(result)
+
       finally:
         test_store.Close()
 
@@ -271,7 +557,71 @@ class SQLiteAttributeContainerStoreTest(test_lib.BaseTestCase):
 
   # TODO: add tests for _ReadAndCheckStorageMetadata
   # TODO: add tests for _ReadMetadata
-  # TODO: add tests for _UpdateStorageMetadataFormatVersion
+
+  def testReadAttributeContainerSequenceNumbers(self):
+    """Tests the _ReadAttributeContainerSequenceNumbers function."""
+    with test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'acstore.sqlite')
+      test_store = sqlite_store.SQLiteAttributeContainerStore()
+      test_store.Open(path=test_path, read_only=False)
+
+      try:
+        sequence_numbers = test_store._ReadAttributeContainerSequenceNumbers()
+        self.assertEqual(sequence_numbers, {})
+
+        for _ in range(3):
+          attribute_container = test_lib.TestAttributeContainer()
+          test_store.AddAttributeContainer(attribute_container)
+
+      finally:
+        test_store.Close()
+
+      test_store.Open(path=test_path, read_only=True)
+
+      try:
+        sequence_numbers = test_store._ReadAttributeContainerSequenceNumbers()
+        self.assertEqual(sequence_numbers, {'test_container': 3})
+
+        number_of_containers = test_store.GetNumberOfAttributeContainers(
+            'test_container')
+        self.assertEqual(number_of_containers, 3)
+
+      finally:
+        test_store.Close()
+
+  def testSerializeAttributeContainer(self):
+    """Tests the _SerializeAttributeContainer function."""
+    attribute_container = test_lib.TestAttributeContainer()
+    attribute_container.attribute = 'MyAttribute'
+
+    test_store = sqlite_store.SQLiteAttributeContainerStore()
+
+    row_values = test_store._SerializeAttributeContainer(attribute_container)
+    self.assertEqual(row_values, ['MyAttribute'])
+
+    del attribute_container.attribute
+
+    row_values = test_store._SerializeAttributeContainer(attribute_container)
+    self.assertEqual(row_values, [None])
+
+  def testUpdateStorageMetadataFormatVersion(self):
+    """Tests the _UpdateStorageMetadataFormatVersion function."""
+    with test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'acstore.sqlite')
+      test_store = sqlite_store.SQLiteAttributeContainerStore()
+      test_store.Open(path=test_path, read_only=False)
+
+      try:
+        format_version = test_store._FORMAT_VERSION + 1
+        test_store._FORMAT_VERSION = format_version
+        test_store._UpdateStorageMetadataFormatVersion()
+
+        metadata_values = test_store._ReadMetadata()
+        self.assertEqual(
+            metadata_values['format_version'], f'{format_version:d}')
+
+      finally:
+        test_store.Close()
 
   def testWriteExistingAttributeContainer(self):
     """Tests the _WriteExistingAttributeContainer function."""
@@ -354,7 +704,40 @@ class SQLiteAttributeContainerStoreTest(test_lib.BaseTestCase):
       with self.assertRaises(IOError):
         test_store.AddAttributeContainer(attribute_container)
 
-  # TODO: add tests for CheckSupportedFormat
+  def testCheckSupportedFormat(self):
+    """Tests the CheckSupportedFormat function."""
+    with test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'acstore.sqlite')
+      test_store = sqlite_store.SQLiteAttributeContainerStore()
+      test_store.Open(path=test_path, read_only=False)
+
+      try:
+        # The metadata is only stored in the WAL file while the store is open.
+        result = (
+            sqlite_store.SQLiteAttributeContainerStore.CheckSupportedFormat(
+                test_path))
+        self.assertTrue(result)
+
+      finally:
+        test_store.Close()
+
+      result = sqlite_store.SQLiteAttributeContainerStore.CheckSupportedFormat(
+          test_path)
+      self.assertTrue(result)
+
+      test_path = os.path.join(temp_directory, 'bogus.sqlite')
+      with open(test_path, 'wb') as file_object:
+        file_object.write(b'bogus')
+
+      result = sqlite_store.SQLiteAttributeContainerStore.CheckSupportedFormat(
+          test_path)
+      self.assertFalse(result)
+
+      test_path = os.path.join(temp_directory, 'missing.sqlite')
+      result = sqlite_store.SQLiteAttributeContainerStore.CheckSupportedFormat(
+          test_path)
+      self.assertFalse(result)
+      self.assertFalse(os.path.exists(test_path))
 
   def testGetAttributeContainerByIdentifier(self):
     """Tests the GetAttributeContainerByIdentifier function."""
@@ -409,6 +792,48 @@ class SQLiteAttributeContainerStoreTest(test_lib.BaseTestCase):
       finally:
         test_store.Close()
 
+  def testGetAttributeContainerByIndexPrefetch(self):
+    """Tests GetAttributeContainerByIndex prefetching consecutive indexes."""
+    with test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'acstore.sqlite')
+      test_store = sqlite_store.SQLiteAttributeContainerStore()
+      test_store.Open(path=test_path, read_only=False)
+
+      try:
+        for index in range(5):
+          attribute_container = test_lib.TestAttributeContainer()
+          attribute_container.attribute = f'{index:d}'
+          test_store.AddAttributeContainer(attribute_container)
+
+        test_store._CommitWriteCache('test_container')
+        test_store._attribute_container_cache.clear()
+
+        # Non-consecutive indexes only retrieve the requested container.
+        container = test_store.GetAttributeContainerByIndex('test_container', 3)
+        self.assertEqual(container.attribute, '3')
+        self.assertEqual(len(test_store._attribute_container_cache), 1)
+
+        container = test_store.GetAttributeContainerByIndex('test_container', 0)
+        self.assertEqual(container.attribute, '0')
+        self.assertEqual(len(test_store._attribute_container_cache), 2)
+
+        # Consecutive indexes retrieve the containers that follow as well.
+        container = test_store.GetAttributeContainerByIndex('test_container', 1)
+        self.assertEqual(container.attribute, '1')
+        self.assertEqual(len(test_store._attribute_container_cache), 5)
+
+        # Test that updating a prefetched container does not leave the previous
+        # version in the cache.
+        containers = list(test_store.GetAttributeContainers('test_container'))
+        containers[4].attribute = 'updated'
+        test_store.UpdateAttributeContainer(containers[4])
+
+        container = test_store.GetAttributeContainerByIndex('test_container', 4)
+        self.assertEqual(container.attribute, 'updated')
+
+      finally:
+        test_store.Close()
+
   def testGetAttributeContainers(self):
     """Tests the GetAttributeContainers function."""
     attribute_container = test_lib.TestAttributeContainer()
@@ -472,10 +897,27 @@ class SQLiteAttributeContainerStoreTest(test_lib.BaseTestCase):
         # present in the storage file.
         query = f'DROP TABLE {attribute_container.CONTAINER_TYPE:s}'
         test_store._cursor.execute(query)
+        test_store._table_names = None
+
         number_of_containers = test_store.GetNumberOfAttributeContainers(
             attribute_container.CONTAINER_TYPE)
         self.assertEqual(number_of_containers, 0)
 
+        # Test that a container that could not be added is not counted.
+        unsupported_container = _TestUnsupportedAttributeContainer()
+        unsupported_container.attribute = 'unsupported'
+
+        with self.assertRaises(IOError):
+          test_store.AddAttributeContainer(unsupported_container)
+
+        number_of_containers = test_store.GetNumberOfAttributeContainers(
+            unsupported_container.CONTAINER_TYPE)
+        self.assertEqual(number_of_containers, 0)
+
+        result = test_store.HasAttributeContainers(
+            unsupported_container.CONTAINER_TYPE)
+        self.assertFalse(result)
+
       finally:
         test_store.Close()
 
@@ -505,7 +947,101 @@ class SQLiteAttributeContainerStoreTest(test_lib.BaseTestCase):
       finally:
         test_store.Close()
 
-  # TODO: add tests for Open and Close
+  def testOpenClose(self):
+    """Tests the Open and Close functions."""
+    with test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'acstore.sqlite')
+      test_store = sqlite_store.SQLiteAttributeContainerStore()
+      test_store.Open(path=test_path, read_only=False)
+
+      try:
+        test_store._cursor.execute('PRAGMA journal_mode')
+        self.assertEqual(test_store._cursor.fetchone()[0], 'wal')
+
+        with self.assertRaises(IOError):
+          test_store.Open(path=test_path, read_only=False)
+
+      finally:
+        test_store.Close()
+
+      self.assertFalse(os.path.exists(f'{test_path:s}-wal'))
+
+      # Test that the closed store uses a rollback journal, which is stored in
+      # bytes 18 and 19 of the file header.
+      with open(test_path, 'rb') as file_object:
+        file_header = file_object.read(20)
+
+      self.assertEqual(file_header[18:20], b'\x01\x01')
+
+      # Test opening the closed store read-only from a read-only location.
+      os.chmod(temp_directory, 0o555)
+
+      try:
+        result = test_store.CheckSupportedFormat(test_path)
+        self.assertTrue(result)
+
+        test_store.Open(path=test_path, read_only=True)
+        test_store.Close()
+
+      finally:
+        os.chmod(temp_directory, 0o755)
+
+      self.assertFalse(os.path.exists(f'{test_path:s}-shm'))
+      self.assertFalse(os.path.exists(f'{test_path:s}-wal'))
+
+      # Test closing while another connection reads from the store.
+      test_store.Open(path=test_path, read_only=False)
+
+      reader_store = sqlite_store.SQLiteAttributeContainerStore()
+      reader_store.Open(path=test_path, read_only=True)
+
+      try:
+        test_store.Close()
+        self.assertFalse(test_store._is_open)
+        self.assertIsNone(test_store._connection)
+
+      finally:
+        reader_store.Close()
+
+      with self.assertRaises(IOError):
+        test_store.Close()
+
+      test_store.Open(
+          path=test_path, read_only=False, journal_mode='memory',
+          synchronous='off')
+
+      try:
+        test_store._cursor.execute('PRAGMA journal_mode')
+        self.assertEqual(test_store._cursor.fetchone()[0], 'memory')
+
+      finally:
+        test_store.Close()
+
+      test_store.Open(path=test_path, read_only=True)
+
+      try:
+        test_store._cursor.execute('PRAGMA query_only')
+        self.assertEqual(test_store._cursor.fetchone()[0], 1)
+
+      finally:
+        test_store.Close()
+
+      test_store = sqlite_store.SQLiteAttributeContainerStore(
+          cache_size=-1024, mmap_size=0)
+      test_store.Open(path=test_path, read_only=True)
+
+      try:
+        test_store._cursor.execute('PRAGMA cache_size')
+        self.assertEqual(test_store._cursor.fetchone()[0], -1024)
+
+      finally:
+        test_store.Close()
+
+      with self.assertRaises(ValueError):
+        test_store.Open(path=test_path, journal_mode='bogus')
+
+      with self.assertRaises(ValueError):
+        test_store.Open(path=test_path, synchronous='bogus')
 
   def testUpdateAttributeContainer(self):
     """Tests the UpdateAttributeContainer function."""
@@ -527,12 +1063,18 @@ class SQLiteAttributeContainerStoreTest(test_lib.BaseTestCase):
             attribute_container.CONTAINER_TYPE)
         self.assertEqual(number_of_containers, 1)
 
+        attribute_container.attribute = 'updated'
         test_store.UpdateAttributeContainer(attribute_container)
 
         number_of_containers = test_store.GetNumberOfAttributeContainers(
             attribute_container.CONTAINER_TYPE)
         self.assertEqual(number_of_containers, 1)
 
+        containers = list(test_store.GetAttributeContainers(
+            attribute_container.CONTAINER_TYPE))
+        self.assertEqual(len(containers), 1)
+        self.assertEqual(containers[0].attribute, 'updated')
+
       finally:
         test_store.Close()
 